@@ -6,6 +6,7 @@ Implements parallel feed fetching with asyncio for better performance
 
 import asyncio
 import aiohttp
+import calendar
 import feedparser
 import logging
 import time
@@ -40,12 +41,12 @@ class AsyncFeedProcessor:
         self.db = get_db()
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
-    async def fetch_feed(self, session: aiohttp.ClientSession, feed: Dict) -> Tuple[Dict, Optional[Dict], Optional[str]]:
+    async def fetch_feed(self, session: aiohttp.ClientSession, feed: Dict) -> Tuple[Dict, Optional[List[Dict]], Optional[str]]:
         """
         Fetch a single feed asynchronously
 
         Returns:
-            Tuple of (feed, latest_entry, error_message)
+            Tuple of (feed, new_entries, error_message); new_entries is newest-first
         """
         async with self.semaphore:
             feed_id = feed['id']
@@ -74,37 +75,25 @@ class AsyncFeedProcessor:
                         self.db.update_feed_check_time(feed_id, error)
                         return (feed, None, error)
 
-                    # Get latest entry
-                    entry = parsed.entries[0]
-
-                    # Extract data with HTML entity decoding
-                    title = html.unescape(entry.title.strip()) if entry.get('title') else "No Title"
-                    link = entry.link.strip() if entry.get('link') else ""
-
-                    # Get publication time
-                    pub_time = None
-                    if entry.get('published_parsed'):
-                        pub_time = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                    elif entry.get('updated_parsed'):
-                        pub_time = datetime.fromtimestamp(time.mktime(entry.updated_parsed))
-
-                    # Extract image from feed
-                    image_url = self._extract_feed_image(entry)
-
-                    latest_entry = {
-                        'title': title,
-                        'link': link,
-                        'published_date': pub_time,
-                        'image_url': image_url,
-                        'fetch_time': fetch_time
-                    }
+                    # Collect every entry newer than the last one we posted. Feeds
+                    # list newest-first, so stop at the first known link. A feed
+                    # with no posting history only yields its newest entry, so
+                    # adding a feed doesn't flood the channel with its backlog.
+                    new_entries = []
+                    for entry in parsed.entries:
+                        link = entry.link.strip() if entry.get('link') else ""
+                        if self.db.is_posted(feed_id, link):
+                            break
+                        new_entries.append(self._build_entry(entry, link, fetch_time))
+                    else:
+                        new_entries = new_entries[:1]
 
                     # Update successful fetch
                     self.db.update_feed_check_time(feed_id, error=None)
 
-                    logging.debug(f"Fetched {feed['name']}: {title} ({fetch_time:.2f}s)")
+                    logging.debug(f"Fetched {feed['name']}: {len(new_entries)} new ({fetch_time:.2f}s)")
 
-                    return (feed, latest_entry, None)
+                    return (feed, new_entries, None)
 
             except asyncio.TimeoutError:
                 error = "Timeout"
@@ -120,6 +109,26 @@ class AsyncFeedProcessor:
                 self.db.update_analytics(feed_id, errors_count=1)
                 return (feed, None, error)
 
+    def _build_entry(self, entry, link: str, fetch_time: float) -> Dict:
+        """Extract the fields we post from a feedparser entry"""
+        # Extract data with HTML entity decoding
+        title = html.unescape(entry.title.strip()) if entry.get('title') else "No Title"
+
+        # Get publication time (feedparser structs are UTC)
+        pub_time = None
+        if entry.get('published_parsed'):
+            pub_time = datetime.fromtimestamp(calendar.timegm(entry.published_parsed))
+        elif entry.get('updated_parsed'):
+            pub_time = datetime.fromtimestamp(calendar.timegm(entry.updated_parsed))
+
+        return {
+            'title': title,
+            'link': link,
+            'published_date': pub_time,
+            'image_url': self._extract_feed_image(entry),
+            'fetch_time': fetch_time
+        }
+
     def _extract_feed_image(self, entry) -> Optional[str]:
         """Extract image URL from feed entry"""
         # Try media:content
@@ -160,11 +169,12 @@ class AsyncFeedProcessor:
                 return None
 
             # Map proxy type string to ProxyType enum
-            if proxy_type.lower() == "socks5":
+            kind = proxy_type.lower()
+            if kind == "socks5":
                 ptype = ProxyType.SOCKS5
-            elif proxy_type.lower() == "socks4":
+            elif kind == "socks4":
                 ptype = ProxyType.SOCKS4
-            elif proxy_type.lower() in ["http", "https"]:
+            elif kind in ("http", "https"):
                 ptype = ProxyType.HTTP
             else:
                 logging.error(f"Unsupported proxy type: {proxy_type}")
@@ -188,7 +198,7 @@ class AsyncFeedProcessor:
                     rdns=True
                 )
 
-            logging.info(f"Created {proxy_type.upper()} proxy connector for async feed fetching")
+            logging.info(f"Created {kind.upper()} proxy connector for async feed fetching")
             return connector
 
         except Exception as e:
@@ -203,7 +213,7 @@ class AsyncFeedProcessor:
             feeds: List of feed dictionaries from database
 
         Returns:
-            List of (feed, latest_entry, error) tuples
+            List of (feed, new_entries, error) tuples
         """
         from proxy_utils import is_url_whitelisted
 
@@ -277,6 +287,7 @@ class AsyncFeedProcessor:
         """
         feeds = self.db.get_feeds(active_only=True)
         feeds_to_check = []
+        now = datetime.now()
 
         for feed in feeds:
             # Check if in quiet hours
@@ -299,7 +310,7 @@ class AsyncFeedProcessor:
                 # Check if enough time has passed since last check
                 if feed['last_checked']:
                     last_check = datetime.fromisoformat(feed['last_checked'])
-                    elapsed = (datetime.now() - last_check).total_seconds()
+                    elapsed = (now - last_check).total_seconds()
 
                     if elapsed < interval:
                         continue
@@ -345,47 +356,49 @@ class AsyncFeedProcessor:
             'time': 0
         }
 
-        for feed, entry, error in results:
+        callbacks = []
+        for feed, entries, error in results:
             if error:
                 stats['errors'] += 1
                 continue
 
-            if not entry:
-                stats['skipped'] += 1
-                continue
-
-            # Check if already posted
-            if self.db.is_posted(feed['id'], entry['link']):
+            if not entries:
                 stats['skipped'] += 1
                 continue
 
-            # Add to history
-            self.db.add_to_history(
-                feed_id=feed['id'],
-                title=entry['title'],
-                link=entry['link'],
-                channel=feed['channel'],
-                platform=feed['platform'],
-                published_date=entry['published_date']
-            )
+            # Post oldest first so channels see entries in publication order
+            for entry in reversed(entries):
+                # Add to history
+                self.db.add_to_history(
+                    feed_id=feed['id'],
+                    title=entry['title'],
+                    link=entry['link'],
+                    channel=feed['channel'],
+                    platform=feed['platform'],
+                    published_date=entry['published_date']
+                )
 
-            # Update analytics
-            self.db.update_analytics(feed['id'], posts_count=1)
+                # Update analytics
+                self.db.update_analytics(feed['id'], posts_count=1)
 
-            stats['new'] += 1
+                stats['new'] += 1
 
-            # Call callback function if provided
-            if callback_func:
-                try:
+                # Queue callback if provided
+                if callback_func:
                     # Add feed metadata to entry
                     entry['feed_name'] = feed['name']
                     entry['channel'] = feed['channel']
                     entry['platform'] = feed['platform']
                     entry['feed_id'] = feed['id']
-
-                    await callback_func(feed, entry)
-                except Exception as e:
-                    logging.error(f"Error in callback for {feed['name']}: {e}")
+                    callbacks.append((feed, entry))
+
+        # Dispatch all new entries together rather than awaiting each in turn
+        if callbacks:
+            outcomes = await asyncio.gather(*(callback_func(feed, entry) for feed, entry in callbacks),
+                                            return_exceptions=True)
+            for (feed, entry), outcome in zip(callbacks, outcomes):
+                if isinstance(outcome, Exception):
+                    logging.error(f"Error in callback for {feed['name']}: {outcome}")
 
         stats['time'] = time.time() - start_time
 
@@ -7,7 +7,7 @@ import os
 from config import default_interval, feeds_file, server, start_time
 from feed import (
     load_feeds, channel_feeds, is_link_posted, mark_link_posted,
-    fetch_latest_article  # now returns (title, link, pub_time)
+    fetch_new_articles  # returns [(title, link, pub_time), ...] newest first
 )
 from image_enhancement import enhance_mma_feed
 from status import irc_client, irc_secondary
@@ -82,11 +82,6 @@ def poll_feeds(irc_send=None, matrix_send=None, discord_send=None, telegram_send
     for raw_chan, feeds in channel_feeds.items():
         for feed_name, url in feeds.items():
             try:
-                # Fetch latest entry with publication timestamp
-                title, link, pub_time = fetch_latest_article(url)
-                if not title or not link:
-                    continue
-
                 # Determine platform and normalized channel key
                 if raw_chan == "mastodon":
                     chan_type = "mastodon"
@@ -113,149 +108,154 @@ def poll_feeds(irc_send=None, matrix_send=None, discord_send=None, telegram_send
                     chan_type = "irc"
                     chan = f"{server}|{raw_chan}"
 
-                # Skip if entry is older than bot start
-                if pub_time and pub_time < start_time:
-                    logging.info(
-                        f"[SKIP OLD] In {chan}, feed '{feed_name}' published at {pub_time} before start time {start_time}. Marking as posted."
-                    )
-                    mark_link_posted(chan, link)
-                    continue
+                # Post every entry newer than the last one posted, oldest first
+                for title, link, pub_time in reversed(fetch_new_articles(url, chan)):
+                    if not title or not link:
+                        continue
 
-                # Skip duplicates
-                if is_link_posted(chan, link):
-                    logging.info(f"[SKIP] {chan} already posted: {link}")
-                    continue
+                    # Skip if entry is older than bot start
+                    if pub_time and pub_time < start_time:
+                        logging.info(
+                            f"[SKIP OLD] In {chan}, feed '{feed_name}' published at {pub_time} before start time {start_time}. Marking as posted."
+                        )
+                        mark_link_posted(chan, link)
+                        continue
 
-                # Mark as posted
-                mark_link_posted(chan, link)
-                _record_history_to_db(feed_name, url, chan, chan_type, title, link)
+                    # Skip duplicates
+                    if is_link_posted(chan, link):
+                        logging.info(f"[SKIP] {chan} already posted: {link}")
+                        continue
 
-                # Prepare public messages
-                title_msg = f"{feed_name}: {title}"
-                link_msg  = f"Link: {link}"
+                    # Mark as posted
+                    mark_link_posted(chan, link)
+                    _record_history_to_db(feed_name, url, chan, chan_type, title, link)
 
-                # Image enhancement disabled - was generating fake URLs
-                image_msg = None
+                    # Prepare public messages
+                    title_msg = f"{feed_name}: {title}"
+                    link_msg  = f"Link: {link}"
 
-                # Dispatch to Mastodon
-                if chan_type == "mastodon":
-                    combined_msg = f"{title_msg}\n{link_msg}"
-                    if mastodon_send:
-                        mastodon_send(chan, combined_msg)
-                    else:
-                        mastodon_fallback(chan, combined_msg)
-                    increment_startup_feeds_counter("Mastodon")
-                # Dispatch to Bluesky
-                elif chan_type == "bluesky":
-                    combined_msg = f"{title_msg}\n{link_msg}"
-                    if bluesky_send:
-                        bluesky_send(chan, combined_msg)
-                    else:
-                        bluesky_fallback(chan, combined_msg)
-                    increment_startup_feeds_counter("Bluesky")
-                # Dispatch to Webhook
-                elif chan_type == "webhook":
-                    combined_msg = f"{title_msg}\n{link_msg}"
-                    if webhook_send:
-                        webhook_send(chan, combined_msg)
-                    else:
-                        webhook_fallback(chan, combined_msg)
-                    increment_startup_feeds_counter("Webhook")
-                # Dispatch to Matrix
-                elif chan_type == "matrix":
-                    combined_msg = f"{title_msg}\n{link_msg}"
-                    if image_msg:
-                        combined_msg += f"\n{image_msg}"
-                    if matrix_send:
-                        matrix_send(chan, combined_msg)
-                    else:
-                        matrix_fallback(chan, combined_msg)
-                    increment_startup_feeds_counter("Matrix")
-                # Dispatch to Discord
-                elif chan_type == "discord":
-                    if discord_send:
-                        discord_send(chan, title_msg)
-                        discord_send(chan, link_msg)
-                        if image_msg:
-                            discord_send(chan, image_msg)
-                    else:
-                        discord_fallback(chan, title_msg)
-                        discord_fallback(chan, link_msg)
-                        if image_msg:
-                            discord_fallback(chan, image_msg)
-                    increment_startup_feeds_counter("Discord")
-                # Dispatch to Telegram
-                elif chan_type == "telegram":
-                    combined_msg = f"{title_msg}\n{link_msg}"
-                    if image_msg:
-                        combined_msg += f"\n{image_msg}"
-                    if telegram_send:
-                        telegram_send(chan, combined_msg)
-                    else:
-                        telegram_fallback(chan, combined_msg)
-                    increment_startup_feeds_counter("Telegram")
-                # Dispatch to IRC
-                elif chan_type == "irc":
-                    if irc_send:
-                        irc_send(chan, title_msg)
-                        irc_send(chan, link_msg)
+                    # Image enhancement disabled - was generating fake URLs
+                    image_msg = None
+
+                    # Dispatch to Mastodon
+                    if chan_type == "mastodon":
+                        combined_msg = f"{title_msg}\n{link_msg}"
+                        if mastodon_send:
+                            mastodon_send(chan, combined_msg)
+                        else:
+                            mastodon_fallback(chan, combined_msg)
+                        increment_startup_feeds_counter("Mastodon")
+                    # Dispatch to Bluesky
+                    elif chan_type == "bluesky":
+                        combined_msg = f"{title_msg}\n{link_msg}"
+                        if bluesky_send:
+                            bluesky_send(chan, combined_msg)
+                        else:
+                            bluesky_fallback(chan, combined_msg)
+                        increment_startup_feeds_counter("Bluesky")
+                    # Dispatch to Webhook
+                    elif chan_type == "webhook":
+                        combined_msg = f"{title_msg}\n{link_msg}"
+                        if webhook_send:
+                            webhook_send(chan, combined_msg)
+                        else:
+                            webhook_fallback(chan, combined_msg)
+                        increment_startup_feeds_counter("Webhook")
+                    # Dispatch to Matrix
+                    elif chan_type == "matrix":
+                        combined_msg = f"{title_msg}\n{link_msg}"
                         if image_msg:
-                            irc_send(chan, image_msg)
-                    else:
-                        net, channel = chan.split("|", 1)
-                        if net == server and irc_client:
-                            irc_client.send_message(channel, title_msg)
-                            irc_client.send_message(channel, link_msg)
+                            combined_msg += f"\n{image_msg}"
+                        if matrix_send:
+                            matrix_send(chan, combined_msg)
+                        else:
+                            matrix_fallback(chan, combined_msg)
+                        increment_startup_feeds_counter("Matrix")
+                    # Dispatch to Discord
+                    elif chan_type == "discord":
+                        if discord_send:
+                            discord_send(chan, title_msg)
+                            discord_send(chan, link_msg)
                             if image_msg:
-                                irc_client.send_message(channel, image_msg)
-                        elif chan in irc_secondary:
-                            client = irc_secondary[chan]
-                            from irc_client import send_message
-                            send_message(client, channel, title_msg)
-                            send_message(client, channel, link_msg)
+                                discord_send(chan, image_msg)
+                        else:
+                            discord_fallback(chan, title_msg)
+                            discord_fallback(chan, link_msg)
                             if image_msg:
-                                send_message(client, channel, image_msg)
-                    increment_startup_feeds_counter("IRC")
-
-                # ── Private subscriptions: send DMs on the appropriate network
-                from feed import subscriptions
-                for user, subs in subscriptions.items():
-                    for sub_name, sub_url in subs.items():
-                        if sub_url != url:
-                            continue
-                        dm = (
-                            f"Subscription '{sub_name}' — {feed_name}:\n"
-                            f"{title}\nLink: {link}"
-                        )
-                        # Matrix users start with '@'
-                        if user.startswith("@"):
-                            if matrix_send:
-                                matrix_send(user, dm)
-                            else:
-                                matrix_fallback(user, dm)
-                            continue
-                        # Discord user IDs are purely digits
-                        if user.isdigit():
-                            if discord_send:
-                                discord_send(user, dm)
-                            else:
-                                discord_fallback(user, dm)
-                            continue
-                        # Telegram users start with '@' or are negative numbers (groups)
-                        if user.startswith("@") or (user.startswith("-") and user[1:].isdigit()):
-                            if telegram_send:
-                                telegram_send(user, dm)
-                            else:
-                                telegram_fallback(user, dm)
-                            continue
-                        # Otherwise assume plain IRC nick
+                                discord_fallback(chan, image_msg)
+                        increment_startup_feeds_counter("Discord")
+                    # Dispatch to Telegram
+                    elif chan_type == "telegram":
+                        combined_msg = f"{title_msg}\n{link_msg}"
+                        if image_msg:
+                            combined_msg += f"\n{image_msg}"
+                        if telegram_send:
+                            telegram_send(chan, combined_msg)
+                        else:
+                            telegram_fallback(chan, combined_msg)
+                        increment_startup_feeds_counter("Telegram")
+                    # Dispatch to IRC
+                    elif chan_type == "irc":
                         if irc_send:
-                            irc_send(f"{server}|{user}", dm)
+                            irc_send(chan, title_msg)
+                            irc_send(chan, link_msg)
+                            if image_msg:
+                                irc_send(chan, image_msg)
                         else:
-                            if irc_client:
-                                irc_client.send_message(user, dm)
+                            net, channel = chan.split("|", 1)
+                            if net == server and irc_client:
+                                irc_client.send_message(channel, title_msg)
+                                irc_client.send_message(channel, link_msg)
+                                if image_msg:
+                                    irc_client.send_message(channel, image_msg)
+                            elif chan in irc_secondary:
+                                client = irc_secondary[chan]
+                                from irc_client import send_message
+                                send_message(client, channel, title_msg)
+                                send_message(client, channel, link_msg)
+                                if image_msg:
+                                    send_message(client, channel, image_msg)
+                        increment_startup_feeds_counter("IRC")
+
+                    # ── Private subscriptions: send DMs on the appropriate network
+                    from feed import subscriptions
+                    for user, subs in subscriptions.items():
+                        for sub_name, sub_url in subs.items():
+                            if sub_url != url:
+                                continue
+                            dm = (
+                                f"Subscription '{sub_name}' — {feed_name}:\n"
+                                f"{title}\nLink: {link}"
+                            )
+                            # Matrix users start with '@'
+                            if user.startswith("@"):
+                                if matrix_send:
+                                    matrix_send(user, dm)
+                                else:
+                                    matrix_fallback(user, dm)
+                                continue
+                            # Discord user IDs are purely digits
+                            if user.isdigit():
+                                if discord_send:
+                                    discord_send(user, dm)
+                                else:
+                                    discord_fallback(user, dm)
+                                continue
+                            # Telegram users start with '@' or are negative numbers (groups)
+                            if user.startswith("@") or (user.startswith("-") and user[1:].isdigit()):
+                                if telegram_send:
+                                    telegram_send(user, dm)
+                                else:
+                                    telegram_fallback(user, dm)
+                                continue
+                            # Otherwise assume plain IRC nick
+                            if irc_send:
+                                irc_send(f"{server}|{user}", dm)
+                            else:
+                                if irc_client:
+                                    irc_client.send_message(user, dm)
 
-                new_feed_count += 1
+                    new_feed_count += 1
 
             except Exception as e:
                 logging.error(f"Error polling {feed_name} in {raw_chan}: {e}")
@@ -1,5 +1,10 @@
 import os, json
 from config import channels_file
+from persistence import save_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 channels_data = {
     "irc_channels": [],
@@ -8,11 +13,28 @@ channels_data = {
     "telegram_channels": []
 }
 
+# (mtime, size) of channels_file when channels_data was last read or written;
+# load_channels skips the re-parse while the file still matches.
+_channels_stamp = None
+
+def _file_stamp():
+    try:
+        st = os.stat(channels_file)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def load_channels():
-    global channels_data
-    if os.path.exists(channels_file):
+    global channels_data, _channels_stamp
+    stamp = _file_stamp()
+    if stamp is not None and stamp == _channels_stamp:
+        return channels_data
+    if stamp is not None:
         try:
-            channels_data = json.load(open(channels_file, "r"))
+            with open(channels_file, "rb") as f:
+                raw = f.read()
+            channels_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _channels_stamp = stamp
         except Exception as e:
             print(f"Error loading {channels_file}: {e}")
             channels_data = {"irc_channels": [], "matrix_channels": [], "discord_channels": [], "telegram_channels": []}
@@ -23,10 +45,9 @@ def load_channels():
     return channels_data
 
 def save_channels():
-    global channels_data
-    try:
-        with open(channels_file, "w") as f:
-            json.dump(channels_data, f, indent=4)
-    except Exception as e:
-        print(f"Error saving {channels_file}: {e}")
+    # Atomic temp-file + rename, so a crash mid-write can't leave a truncated
+    # channels.json that the next load_channels resets to empty.
+    global _channels_stamp
+    save_json(channels_file, channels_data)
+    _channels_stamp = _file_stamp()
 
@@ -2,6 +2,7 @@ import requests
 import feedparser
 import logging
 import fnmatch
+import re
 import json
 import datetime
 import threading
@@ -10,9 +11,16 @@ import sys
 import os
 import importlib
 import asyncio
+import atexit
 import shlex
-
-from config import admin, ops, admins, admin_file, server, channels as config_channels
+from collections import OrderedDict
+from functools import lru_cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from config import admin, admin_file, server, channels as config_channels, start_time as config_start_time
 import feed
 import persistence
 import channels
@@ -24,9 +32,117 @@ RATE_LIMIT_SECONDS = 3
 BLOCK_DURATION = 300  # 5 minutes
 VIOLATION_THRESHOLD = 3
 
+# Monotonic equivalent of config.start_time, so !stats uptime ignores wall-clock jumps.
+START_MONOTONIC = time.monotonic() - (time.time() - config_start_time)
+
+# Lower-cased global admin and op names; rebuilt by refresh_admins() after !reload.
+_GLOBAL_ADMINS = frozenset()
+_GLOBAL_OPS = frozenset()
+
+def refresh_admins():
+    global _GLOBAL_ADMINS, _GLOBAL_OPS
+    import config
+    _GLOBAL_ADMINS = frozenset(a.lower() for a in config.admins)
+    _GLOBAL_OPS = frozenset(op.lower() for op in config.ops)
+
+refresh_admins()
+
 last_command_timestamp = {}
 user_abuse = {}
 
+# Channel admin mapping from admin_file, loaded once and kept in memory.
+# Changes are written back on a short debounce timer so !join/!part don't do
+# synchronous file I/O on the calling platform's thread.
+ADMIN_FLUSH_DELAY = 1.0
+_admin_mapping = None
+_admin_lock = threading.Lock()
+_admin_flush_timer = None
+
+# Short-lived cache of fetch_latest_article results for !latest and friends,
+# so several users asking for the same feed don't each trigger a fetch.
+# Least recently used entries are evicted once LATEST_CACHE_MAX is reached.
+LATEST_CACHE_TTL = 60
+LATEST_CACHE_MAX = 512
+_latest_cache = OrderedDict()
+_latest_cache_lock = threading.Lock()
+
+def fetch_latest_cached(url):
+    now = time.monotonic()
+    with _latest_cache_lock:
+        entry = _latest_cache.get(url)
+        if entry and now - entry[0] < LATEST_CACHE_TTL:
+            _latest_cache.move_to_end(url)
+            return entry[1]
+    result = feed.fetch_latest_article(url)
+    if result[0] and result[1]:
+        with _latest_cache_lock:
+            _latest_cache[url] = (now, result)
+            _latest_cache.move_to_end(url)
+            if len(_latest_cache) > LATEST_CACHE_MAX:
+                _latest_cache.popitem(last=False)
+    return result
+
+def get_admin_mapping():
+    global _admin_mapping
+    with _admin_lock:
+        if _admin_mapping is None:
+            try:
+                with open(admin_file, "r") as f:
+                    _admin_mapping = json.load(f)
+            except FileNotFoundError:
+                _admin_mapping = {}
+            except Exception as e:
+                logging.error(f"Error reading admin_file {admin_file}: {e}")
+                _admin_mapping = {}
+        return _admin_mapping
+
+def _write_admin_mapping():
+    global _admin_flush_timer
+    with _admin_lock:
+        _admin_flush_timer = None
+        data = dict(_admin_mapping or {})
+    try:
+        # Indented: people edit this file by hand.
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        tmp = admin_file + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, admin_file)
+    except Exception as e:
+        logging.error(f"Error writing admin_file {admin_file}: {e}")
+
+def schedule_admin_flush():
+    """Write the admin mapping after ADMIN_FLUSH_DELAY, coalescing bursts of changes."""
+    global _admin_flush_timer
+    with _admin_lock:
+        if _admin_flush_timer is not None:
+            _admin_flush_timer.cancel()
+        _admin_flush_timer = threading.Timer(ADMIN_FLUSH_DELAY, _write_admin_mapping)
+        _admin_flush_timer.daemon = True
+        _admin_flush_timer.start()
+
+def flush_admin_mapping():
+    """Write a pending admin mapping change now instead of waiting for the timer."""
+    with _admin_lock:
+        timer = _admin_flush_timer
+        if timer is None:
+            return
+        timer.cancel()
+    _write_admin_mapping()
+
+# The flush timer is a daemon thread, so make sure a pending write isn't lost on exit.
+atexit.register(flush_admin_mapping)
+
+def reload_admin_mapping():
+    """Write any pending change, then re-read admin_file on next use (picks up hand edits)."""
+    global _admin_mapping
+    flush_admin_mapping()
+    with _admin_lock:
+        _admin_mapping = None
+
 def get_network_for_channel(channel):
     if channel in config_channels:
         return server
@@ -73,6 +189,21 @@ def load_help_data():
 
 help_data = load_help_data()
 
+HELP_OVERVIEW = (
+    "Available Help Categories:\n"
+    "  USER  - Basic usage commands any user can run\n"
+    "  OP    - Channel OP/Admin commands\n"
+    "  OWNER - Bot owner commands\n"
+    "Type: !help <category> (e.g. !help user) to see details."
+)
+
+# !help output never changes after help.json is loaded, so render it once.
+help_texts = {
+    category: f"Commands for {category}:\n" + "\n".join(f"{cmd}: {desc}" for cmd, desc in cmds.items())
+    for category, cmds in help_data.items()
+    if isinstance(cmds, dict)
+}
+
 def get_help(command=None):
     if command:
         return help_data.get(command.lower(), f"No detailed help available for '{command}'.")
@@ -105,11 +236,17 @@ def search_feeds(query):
         logging.error("Error searching feeds: %s", e)
         return []
 
+@lru_cache(maxsize=256)
+def _glob_match(pattern):
+    """Case-insensitive compiled matcher for a glob pattern, built once per pattern."""
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+
 # Compare feed names case-insensitively.
 def match_feed(feed_dict, pattern):
     pattern_lower = pattern.lower()
     if "*" in pattern or "?" in pattern:
-        matches = [name for name in feed_dict.keys() if fnmatch.fnmatch(name.lower(), pattern_lower)]
+        match = _glob_match(pattern_lower)
+        matches = [name for name in feed_dict if match(name)]
         if len(matches) == 1:
             return matches[0]
         elif len(matches) == 0:
@@ -117,11 +254,18 @@ def match_feed(feed_dict, pattern):
         else:
             return matches
     else:
-        for key in feed_dict.keys():
+        # Exact-case hit is the common case and needs no scan.
+        if pattern in feed_dict:
+            return pattern
+        for key in feed_dict:
             if key.lower() == pattern_lower:
                 return key
         return None
 
+def format_feed_list(feeds):
+    """One "name: url" line per feed, for !listfeeds."""
+    return "\n".join(["%s: %s" % item for item in feeds.items()])
+
 def parse_quoted_args(message):
     """Parse command arguments with support for quoted strings"""
     try:
@@ -143,6 +287,8 @@ def response_target(actual_channel, integration):
     return actual_channel
 
 # Normalize username keys by stripping whitespace and, for Discord, splitting at '#' and lowercasing.
+# Senders recur constantly, so cache the normalized key per (user, integration).
+@lru_cache(maxsize=4096)
 def get_user_key(user, integration):
     user = user.strip()
     if integration == "discord":
@@ -155,8 +301,30 @@ def get_user_key(user, integration):
     else:
         return user.lower()
 
+# First word of every command handle_centralized_command dispatches on.
+KNOWN_COMMANDS = frozenset({
+    "!addsub", "!unsub", "!mysubs", "!latestsub", "!join", "!part", "!addfeed",
+    "!delfeed", "!listfeeds", "!latest", "!getfeed", "!getadd", "!genfeed",
+    "!setinterval", "!search", "!schedule", "!mute", "!unmute", "!network",
+    "!webhook", "!setsetting", "!getsetting", "!settings", "!admin", "!stats",
+    "!restart", "!quit", "!reload", "!ping", "!help",
+})
+_KNOWN_PREFIXES = tuple(KNOWN_COMMANDS)
+
+def is_known_command(message):
+    words = message.lower().split(None, 1)
+    if not words:
+        return False
+    if words[0] in KNOWN_COMMANDS:
+        return True
+    # The dispatch below matches on prefixes, so e.g. "!listfeeds2" still reaches !listfeeds.
+    return words[0].startswith(_KNOWN_PREFIXES)
+
 def handle_centralized_command(integration, send_message_fn, send_private_message_fn, send_multiline_message_fn,
                                user, target, message, is_op_flag, irc_conn=None):
+    # Drop unknown commands before any permission or rate-limit bookkeeping.
+    if not is_known_command(message):
+        return
     now = time.time()
     user_key = get_user_key(user, integration)
     
@@ -165,10 +333,10 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
     is_super_admin = (user_key == admin.lower())
     
     # 2. Check if user is in the admins list
-    is_global_admin = user_key in [a.lower() for a in admins]
+    is_global_admin = user_key in _GLOBAL_ADMINS
     
     # 3. Check if user is in ops list
-    is_global_op = user_key in [op.lower() for op in ops]
+    is_global_op = user_key in _GLOBAL_OPS
     
     # 4. For Discord, also check computed_op flag
     if integration == "discord":
@@ -202,12 +370,7 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
     logging.info(f"[commands.py] Permission check - user_key: {user_key}, is_super_admin: {is_super_admin}, is_global_admin: {is_global_admin}, effective_op: {effective_op}")
 
     # 6. Load channel admin mapping
-    try:
-        with open(admin_file, "r") as f:
-            admin_mapping = json.load(f)
-    except Exception as e:
-        admin_mapping = {}
-        logging.error(f"Error reading admin_file {admin_file}: {e}")
+    admin_mapping = get_admin_mapping()
 
     # 7. Check channel admin status - be flexible with key matching
     is_channel_admin = False
@@ -289,7 +452,7 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
         sub_name = parts[1].strip().lower()
         if user_key in feed.subscriptions and sub_name in feed.subscriptions[user_key]:
             url = feed.subscriptions[user_key][sub_name]
-            title, link, pub_time = feed.fetch_latest_article(url)
+            title, link, pub_time = fetch_latest_cached(url)
             if title and link:
                 combined_message = f"Latest from your subscription '{sub_name}':\n{title}\nLink: {link}"
                 multiline_send(send_multiline_message_fn, user, combined_message)
@@ -317,14 +480,8 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             if join_channel not in channels_data["irc_channels"]:
                 channels_data["irc_channels"].append(join_channel)
             channels.save_channels()
-            if os.path.exists(admin_file):
-                with open(admin_file, "r") as f:
-                    admin_mapping = json.load(f)
-            else:
-                admin_mapping = {}
             admin_mapping[join_channel] = join_admin
-            with open(admin_file, "w") as f:
-                json.dump(admin_mapping, f, indent=4)
+            schedule_admin_flush()
             send_message_fn(response_target(actual_channel, integration), f"Joined channel: {join_channel} with admin: {join_admin}")
             if integration == "irc" and irc_conn:
                 irc_conn.send(f"JOIN {join_channel}\r\n".encode("utf-8"))
@@ -354,15 +511,8 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             elif comp_key in feed.channel_feeds:
                 del feed.channel_feeds[comp_key]
             feed.save_feeds()
-            if os.path.exists(admin_file):
-                with open(admin_file, "r") as f:
-                    admin_mapping = json.load(f)
-            else:
-                admin_mapping = {}
-            if part_channel in admin_mapping:
-                del admin_mapping[part_channel]
-            with open(admin_file, "w") as f:
-                json.dump(admin_mapping, f, indent=4)
+            if admin_mapping.pop(part_channel, None) is not None:
+                schedule_admin_flush()
             send_message_fn(response_target(actual_channel, integration), f"Leaving channel: {part_channel}")
             try:
                 from irc_client import current_irc_client
@@ -459,13 +609,12 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             return
         
         target_channel = parts[1].strip()
-        logging.info(f"[DEBUG] Looking for feeds in channel: '{target_channel}'")
-        logging.info(f"[DEBUG] Available channels: {list(feed.channel_feeds.keys())}")
+        logging.debug("Looking for feeds in channel: '%s'", target_channel)
+        logging.debug("Available channels: %s", feed.channel_feeds.keys())
         
         if target_channel in feed.channel_feeds and feed.channel_feeds[target_channel]:
             found_feeds = feed.channel_feeds[target_channel]
-            lines = [f"{name}: {url}" for name, url in found_feeds.items()]
-            multiline_send(send_multiline_message_fn, response_target(actual_channel, integration), f"Feeds for {target_channel}:\n\n" + "\n".join(lines))
+            multiline_send(send_multiline_message_fn, response_target(actual_channel, integration), f"Feeds for {target_channel}:\n\n" + format_feed_list(found_feeds))
         else:
             send_message_fn(response_target(actual_channel, integration), f"No feeds found for channel: '{target_channel}'.")
     elif lower_message.startswith("!listfeeds"):
@@ -486,8 +635,7 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
                         break
         
         if found_feeds:
-            lines = [f"{name}: {url}" for name, url in found_feeds.items()]
-            multiline_send(send_multiline_message_fn, response_target(actual_channel, integration), "\n".join(lines))
+            multiline_send(send_multiline_message_fn, response_target(actual_channel, integration), format_feed_list(found_feeds))
         else:
             # If no feeds found and user is authorized, show relevant channels
             if is_authorized:
@@ -553,7 +701,7 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             send_message_fn(response_target(actual_channel, integration), f"Multiple feeds match '{pattern}': {', '.join(matched)}. Please be more specific.")
             return
         feed_name = matched
-        title, link, pub_time = feed.fetch_latest_article(feed.channel_feeds[channel_key][feed_name])
+        title, link, pub_time = fetch_latest_cached(feed.channel_feeds[channel_key][feed_name])
         if title and link:
             if integration == "matrix":
                 combined = f"Latest from {feed_name}: {title}\nURL: {link}"
@@ -575,7 +723,7 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             send_message_fn(response_target(actual_channel, integration), "No matching feed found.")
             return
         feed_title, feed_url = results[0]
-        title, link, pub_time = feed.fetch_latest_article(feed_url)
+        title, link, pub_time = fetch_latest_cached(feed_url)
         if title and link:
             send_message_fn(response_target(actual_channel, integration), f"Latest from {feed_title}: {title}")
             send_message_fn(response_target(actual_channel, integration), f"Link: {link}")
@@ -1165,8 +1313,6 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
 
     elif lower_message.startswith("!admin"):
         try:
-            with open(admin_file, "r") as f:
-                admin_mapping = json.load(f)
             if is_super_admin or is_global_admin:
                 irc_admins = {k: v for k, v in admin_mapping.items() if k.startswith("#")}
                 discord_admins = {k: v for k, v in admin_mapping.items() if k.isdigit()}
@@ -1185,7 +1331,7 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
 
     elif lower_message.startswith("!stats"):
         response_target_value = response_target(actual_channel, integration)
-        uptime_seconds = int(time.time() - __import__("config").start_time)
+        uptime_seconds = int(time.monotonic() - START_MONOTONIC)
         uptime = str(datetime.timedelta(seconds=uptime_seconds))
         if is_super_admin or is_global_admin:
             irc_keys = [k for k in feed.channel_feeds if "|" in k or k.startswith("#")]
@@ -1240,6 +1386,12 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             asyncio.run(graceful_shutdown())
         except Exception as e:
             logging.error(f"Error during graceful shutdown: {e}")
+        # execv skips atexit handlers, so flush every write-behind store here.
+        flush_admin_mapping()
+        users.flush_users()
+        matrix = sys.modules.get("matrix_integration")
+        if matrix is not None:
+            matrix.flush_dm_rooms()
         os.execv(sys.executable, [sys.executable] + sys.argv)
 
     elif lower_message.startswith("!quit"):
@@ -1283,6 +1435,12 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
             return
         try:
             importlib.reload(__import__("config"))
+            refresh_admins()
+            reload_admin_mapping()
+            for module_name in ("matrix_integration", "telegram_integration"):
+                module = sys.modules.get(module_name)
+                if module is not None:
+                    module.refresh_admins()
             send_message_fn(response_target(actual_channel, integration), "Configuration reloaded.")
         except Exception as e:
             send_message_fn(response_target(actual_channel, integration), f"Error reloading config: {e}")
@@ -1315,20 +1473,11 @@ def handle_centralized_command(integration, send_message_fn, send_private_messag
     elif lower_message.startswith("!help"):
         parts = message.split(" ", 1)
         if len(parts) == 1:
-            help_text = (
-                "Available Help Categories:\n"
-                "  USER  - Basic usage commands any user can run\n"
-                "  OP    - Channel OP/Admin commands\n"
-                "  OWNER - Bot owner commands\n"
-                "Type: !help <category> (e.g. !help user) to see details."
-            )
+            help_text = HELP_OVERVIEW
         else:
             category = parts[1].strip().upper()
-            if category in help_data:
-                cmds = help_data[category]
-                lines = [f"{cmd}: {desc}" for cmd, desc in cmds.items()]
-                help_text = f"Commands for {category}:\n" + "\n".join(lines)
-            else:
+            help_text = help_texts.get(category)
+            if help_text is None:
                 help_text = f"No help information found for '{parts[1].strip()}'."
         multiline_send(send_multiline_message_fn, user, help_text)
 
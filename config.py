@@ -120,3 +120,10 @@ proxy_whitelist = [
     # Add more domains as needed
 ]
 
+# Set to True to skip certificate checks on proxied TLS connections
+# (e.g. IRC servers with self-signed certificates)
+insecure_proxy_tls = False
+
+# URL sent a HEAD request at startup to check the proxy works
+proxy_test_url = "http://httpbin.org/ip"
+
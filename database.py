@@ -11,6 +11,7 @@ import os
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Tuple
 import threading
+from contextlib import contextmanager
 
 # Thread-local storage for database connections
 _thread_local = threading.local()
@@ -34,6 +35,41 @@ class Database:
             _thread_local.connection.row_factory = sqlite3.Row
         return _thread_local.connection
 
+    def _commit(self, conn):
+        """Commit unless a batch() is open on this thread"""
+        if not getattr(_thread_local, 'in_batch', False):
+            conn.commit()
+
+    @contextmanager
+    def batch(self, fast_sync: bool = False):
+        """Group many writes on this thread into a single transaction.
+
+        Bulk loaders (see migrate_to_db.py) otherwise pay one fsync per row.
+        With fast_sync the connection runs the batch with synchronous=NORMAL,
+        syncing less often: a power loss can corrupt or lose the batch, so only
+        use it for loads that can be re-run. The journal mode is left alone and
+        the previous synchronous setting is restored afterwards.
+        """
+        conn = self.get_connection()
+        if getattr(_thread_local, 'in_batch', False):
+            yield conn
+            return
+        previous_sync = None
+        if fast_sync:
+            previous_sync = conn.execute('PRAGMA synchronous').fetchone()[0]
+            conn.execute('PRAGMA synchronous=NORMAL')
+        _thread_local.in_batch = True
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            _thread_local.in_batch = False
+            if previous_sync is not None:
+                conn.execute(f'PRAGMA synchronous={int(previous_sync)}')
+
     def init_database(self):
         """Create database tables if they don't exist"""
         conn = self.get_connection()
@@ -192,7 +228,7 @@ class Database:
                 INSERT INTO feeds (name, url, channel, platform)
                 VALUES (?, ?, ?, ?)
             ''', (name, url, channel, platform))
-            conn.commit()
+            self._commit(conn)
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             logging.warning(f"Feed {name} already exists in {channel}")
@@ -204,7 +240,7 @@ class Database:
         cursor = conn.cursor()
 
         cursor.execute('DELETE FROM feeds WHERE name = ? AND channel = ?', (name, channel))
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount > 0
 
     def get_feeds(self, channel: str = None, active_only: bool = True) -> List[Dict]:
@@ -256,7 +292,7 @@ class Database:
                 WHERE id = ?
             ''', (feed_id,))
 
-        conn.commit()
+        self._commit(conn)
 
     # ========== FEED HISTORY ==========
 
@@ -277,12 +313,33 @@ class Database:
                 UPDATE feeds SET last_post_time = CURRENT_TIMESTAMP WHERE id = ?
             ''', (feed_id,))
 
-            conn.commit()
+            self._commit(conn)
             return True
         except sqlite3.IntegrityError:
             # Already posted
             return False
 
+    def add_many_to_history(self, feed_id: int, links: List[str], title: str,
+                            channel: str, platform: str) -> int:
+        """Add many links for one feed to history, returning how many were new"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        before = conn.total_changes
+        cursor.executemany('''
+            INSERT OR IGNORE INTO feed_history (feed_id, title, link, channel, platform)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(feed_id, title, link, channel, platform) for link in links])
+        added = conn.total_changes - before
+
+        if added:
+            cursor.execute('''
+                UPDATE feeds SET last_post_time = CURRENT_TIMESTAMP WHERE id = ?
+            ''', (feed_id,))
+
+        self._commit(conn)
+        return added
+
     def is_posted(self, feed_id: int, link: str) -> bool:
         """Check if a link has already been posted"""
         conn = self.get_connection()
@@ -435,7 +492,7 @@ class Database:
                 errors_count = errors_count + ?
         ''', (feed_id, today, posts_count, errors_count, posts_count, errors_count))
 
-        conn.commit()
+        self._commit(conn)
 
     # ========== SCHEDULING ==========
 
@@ -475,7 +532,24 @@ class Database:
                 VALUES (?, ?, ?, ?, ?)
             ''', (feed_id, interval_seconds or 900, priority or 0, quiet_start, quiet_end))
 
-        conn.commit()
+        self._commit(conn)
+
+    def set_feed_schedules(self, feed_ids: List[int], interval_seconds: int = 900,
+                           priority: int = 0):
+        """Set interval and priority for many feeds in one transaction"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        # Update existing rows (keeping quiet hours), then insert the rest
+        cursor.executemany('''
+            UPDATE feed_schedules SET interval_seconds = ?, priority = ? WHERE feed_id = ?
+        ''', [(interval_seconds, priority, feed_id) for feed_id in feed_ids])
+        cursor.executemany('''
+            INSERT OR IGNORE INTO feed_schedules (feed_id, interval_seconds, priority)
+            VALUES (?, ?, ?)
+        ''', [(feed_id, interval_seconds, priority) for feed_id in feed_ids])
+
+        self._commit(conn)
 
     def get_feed_schedule(self, feed_id: int) -> Optional[Dict]:
         """Get schedule for a specific feed"""
@@ -514,7 +588,7 @@ class Database:
                 INSERT INTO users (username, platform, user_id, last_active)
                 VALUES (?, ?, ?, CURRENT_TIMESTAMP)
             ''', (username, platform, user_id))
-            conn.commit()
+            self._commit(conn)
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Update existing user
@@ -522,7 +596,7 @@ class Database:
                 UPDATE users SET last_active = CURRENT_TIMESTAMP
                 WHERE platform = ? AND user_id = ?
             ''', (platform, user_id))
-            conn.commit()
+            self._commit(conn)
 
             cursor.execute('SELECT id FROM users WHERE platform = ? AND user_id = ?', (platform, user_id))
             return cursor.fetchone()[0]
@@ -540,7 +614,7 @@ class Database:
                 updated_at = CURRENT_TIMESTAMP
         ''', (user_db_id, key, value, value))
 
-        conn.commit()
+        self._commit(conn)
 
     def get_user_preference(self, user_db_id: int, key: str) -> Optional[str]:
         """Get a user preference"""
@@ -596,7 +670,7 @@ class Database:
                 reason = ?
         ''', (user_db_id, feed_id, muted_until, reason, muted_until, reason))
 
-        conn.commit()
+        self._commit(conn)
 
     def unmute_feed(self, user_db_id: int, feed_id: int):
         """Unmute a feed for a user"""
@@ -605,7 +679,7 @@ class Database:
 
         cursor.execute('DELETE FROM muted_feeds WHERE user_id = ? AND feed_id = ?',
                       (user_db_id, feed_id))
-        conn.commit()
+        self._commit(conn)
 
     def get_muted_feeds(self, user_db_id: int) -> List[Dict]:
         """Get all muted feeds for a user"""
@@ -654,7 +728,7 @@ class Database:
         ''', (feed_id, platform, title_format, link_format, custom_format,
               int(use_embeds), embed_color, int(include_image)))
 
-        conn.commit()
+        self._commit(conn)
 
     def get_feed_template(self, feed_id: int, platform: str) -> Optional[Dict]:
         """Get template for a specific feed and platform"""
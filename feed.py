@@ -1,3 +1,4 @@
+import calendar
 import feedparser
 import requests
 import time
@@ -5,15 +6,25 @@ import logging
 import json
 import datetime
 import html
+import importlib.util
+import threading
 from persistence import load_json, save_json
 import os, json, logging
 try:
-    from proxy_utils import create_proxy_opener
+    from proxy_utils import create_proxy_opener, is_url_whitelisted, PROXIES
+    from config import enable_proxy, feeds_only_proxy, proxy_http, proxy_type
     PROXY_AVAILABLE = True
+    # Feeds are only fetched through SOCKS proxies; other types go direct.
+    FEED_PROXIES = PROXIES if proxy_type.lower().startswith("socks") else None
 except ImportError:
     logging.warning("Proxy support not available for HTTP requests")
     PROXY_AVAILABLE = False
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 feedparser.USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) FuzzyFeeds/1.0"
 
 FEEDS_FILE = os.path.join(os.path.dirname(__file__), "feeds.json")
@@ -45,63 +56,134 @@ class FeedStore:
             json.dump(self.channel_feeds, f, indent=2)
 
 
+# Per-URL HTTP validators and the last entries seen, so unchanged feeds can be
+# fetched with a conditional GET and answered from memory on 304 Not Modified.
+_http_validators = {}
+_last_entries = {}
+# Hash of the last body fetched per URL, so a server that sends no validators
+# but serves identical content is answered from memory without re-parsing.
+_body_hashes = {}
+
+# Feeds may declare how long they can be cached (<ttl> in minutes, or
+# sy:updatePeriod/updateFrequency). Until that has passed, the poller is
+# answered from _last_entries without touching the network; on-demand
+# lookups like !latest always fetch. Capped so a feed with a huge TTL is
+# still looked at a few times a day.
+FEED_TTL_MAX = 6 * 3600
+_SY_PERIODS = {"hourly": 3600, "daily": 86400, "weekly": 604800, "monthly": 2592000, "yearly": 31536000}
+_feed_ttl = {}
+_next_due = {}
+
+def _declared_ttl(d):
+    info = d.get("feed") or {}
+    try:
+        ttl = int(info.get("ttl") or 0) * 60
+    except (TypeError, ValueError):
+        ttl = 0
+    if not ttl:
+        period = _SY_PERIODS.get(str(info.get("sy_updateperiod", "")).strip().lower())
+        if period:
+            try:
+                frequency = max(1, int(info.get("sy_updatefrequency") or 1))
+            except (TypeError, ValueError):
+                frequency = 1
+            ttl = period // frequency
+    return min(ttl, FEED_TTL_MAX)
+
+# One requests.Session per thread so repeated polls of the same hosts reuse
+# kept-alive connections instead of a new TCP/TLS handshake per fetch.
+_thread_local = threading.local()
+
+def _http_session():
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+# With httpx installed, feed fetches go through one shared client per route
+# (direct or proxied) instead of a requests.Session per thread; with h2 also
+# present, fetches from the same host multiplex over one HTTP/2 connection.
+# A route httpx can't serve (e.g. SOCKS4, SOCKS without the socksio extra,
+# or any proxy on httpx < 0.26, which lacks proxy=) is cached as None and
+# falls back to requests.
+_HTTP2 = httpx is not None and importlib.util.find_spec("h2") is not None
+_httpx_clients = {}
+_httpx_lock = threading.Lock()
+
+def _httpx_client(proxy_url):
+    if proxy_url not in _httpx_clients:
+        with _httpx_lock:
+            if proxy_url not in _httpx_clients:
+                try:
+                    client = httpx.Client(
+                        http2=_HTTP2, proxy=proxy_url, follow_redirects=True, timeout=10,
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16))
+                except (ImportError, ValueError, TypeError) as e:
+                    logging.warning(f"[feed.py] httpx can't use {proxy_url or 'direct'} route, using requests: {e}")
+                    client = None
+                _httpx_clients[proxy_url] = client
+    return _httpx_clients[proxy_url]
+
+def _http_get(url, headers, proxies=None):
+    client = _httpx_client(proxies["https"] if proxies else None) if httpx is not None else None
+    if client is not None:
+        return client.get(url, headers=headers)
+    return _http_session().get(url, headers=headers, proxies=proxies, timeout=10)
+
+def _parse_response(url, resp):
+    if resp.status_code == 304:
+        return feedparser.FeedParserDict(status=304, entries=[])
+    if resp.status_code != 200:
+        logging.error(f"[feed.py] Feed returned {resp.status_code}: {resp.text[:200]}")
+        return feedparser.FeedParserDict()
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _http_validators[url] = (etag, last_modified)
+    body_hash = hash(resp.content)
+    if _body_hashes.get(url) == body_hash and url in _last_entries:
+        return feedparser.FeedParserDict(status=304, entries=[])
+    _body_hashes[url] = body_hash
+    return feedparser.parse(resp.text)
+
 def parse_with_custom_user_agent(url):
     headers = {
         "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) FuzzyFeeds/1.0"
     }
+    # Only send validators if we can answer a 304 from the last parsed entries.
+    if url in _last_entries and url in _http_validators:
+        etag, last_modified = _http_validators[url]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
     try:
         # Check if URL should bypass proxy (whitelisted)
         if PROXY_AVAILABLE:
-            from proxy_utils import is_url_whitelisted
-            from config import enable_proxy, feeds_only_proxy, proxy_http, proxy_type, proxy_host, proxy_port, proxy_username, proxy_password
-            
             use_proxy = False
             if enable_proxy and (feeds_only_proxy or proxy_http):
                 if not is_url_whitelisted(url):
                     use_proxy = True
             
-            if use_proxy and proxy_type.lower().startswith("socks"):
+            if use_proxy and FEED_PROXIES:
                 # Use requests with SOCKS proxy for better control
-                if proxy_username and proxy_password:
-                    auth_string = f"{proxy_username}:{proxy_password}@"
-                else:
-                    auth_string = ""
-                
-                if proxy_type.lower() == "socks5":
-                    proxy_url = f"socks5://{auth_string}{proxy_host}:{proxy_port}"
-                else:
-                    proxy_url = f"socks4://{auth_string}{proxy_host}:{proxy_port}"
-                
-                proxies = {
-                    'http': proxy_url,
-                    'https': proxy_url
-                }
-                
                 logging.info(f"Using SOCKS proxy for {url}")
-                resp = requests.get(url, headers=headers, proxies=proxies, timeout=10)
-                if resp.status_code != 200:
-                    logging.error(f"[feed.py] Feed returned {resp.status_code}: {resp.text[:200]}")
-                    return feedparser.FeedParserDict()
-                return feedparser.parse(resp.text)
+                resp = _http_get(url, headers, FEED_PROXIES)
+                return _parse_response(url, resp)
             else:
                 # Direct connection (either no proxy or whitelisted)
                 if is_url_whitelisted(url):
                     logging.info(f"Using direct connection for whitelisted URL: {url}")
-                resp = requests.get(url, headers=headers, timeout=10)
-                if resp.status_code != 200:
-                    logging.error(f"[feed.py] Feed returned {resp.status_code}: {resp.text[:200]}")
-                    return feedparser.FeedParserDict()
-                return feedparser.parse(resp.text)
+                resp = _http_get(url, headers)
+                return _parse_response(url, resp)
         else:
             # Fallback to requests without proxy
             pass
         
         # Use requests for all cases (with or without proxy)
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code != 200:
-            logging.error(f"[feed.py] Feed returned {resp.status_code}: {resp.text[:200]}")
-            return feedparser.FeedParserDict()
-        return feedparser.parse(resp.text)
+        resp = _http_get(url, headers)
+        return _parse_response(url, resp)
         
     except Exception as e:
         logging.error(f"[feed.py] Error making HTTP request to {url}: {e}")
@@ -158,11 +240,14 @@ def migrate_plain_keys_to_composite():
         for chan in net_info.get("Channels", []):
             if chan in posted_links:
                 composite_key = f"{server_name}|{chan}"
-                if composite_key not in posted_links:
-                    posted_links[composite_key] = posted_links[chan]
+                plain = posted_links.pop(chan)
+                existing = posted_links.get(composite_key)
+                if not existing:
+                    posted_links[composite_key] = plain
                 else:
-                    posted_links[composite_key] = list(set(posted_links[composite_key] + posted_links[chan]))
-                del posted_links[chan]
+                    # Append only unseen links, keeping the existing order.
+                    seen = set(existing)
+                    existing.extend(x for x in plain if not (x in seen or seen.add(x)))
                 links_changed = True
     if links_changed:
         save_json(POSTED_LINKS_FILE, posted_links)
@@ -253,25 +338,58 @@ def mark_link_posted(channel, link):
         posted_links[channel].append(link)
         save_posted_links()
 
-def fetch_latest_article(url):
+def _entry_fields(entry):
+    # Decode HTML entities in title (e.g., &#8216; -> ', &#8230; -> …)
+    raw_title = entry.title.strip() if entry.get("title") else "No Title"
+    title = html.unescape(raw_title)
+    link = entry.link.strip() if entry.get("link") else ""
+    # Attempt to get publication time from 'published_parsed' or 'updated_parsed'.
+    # feedparser normalizes these to UTC, so use timegm rather than the
+    # local-time mktime.
+    if entry.get("published_parsed"):
+        pub_time = calendar.timegm(entry.published_parsed)
+    elif entry.get("updated_parsed"):
+        pub_time = calendar.timegm(entry.updated_parsed)
+    else:
+        pub_time = 0
+    return title, link, pub_time
+
+def _fetch_entries(url, honor_ttl=False):
+    """Return the feed's entries as (title, link, pub_time) tuples, newest first."""
+    now = time.monotonic()
+    if honor_ttl and url in _last_entries and now < _next_due.get(url, 0):
+        return _last_entries[url]
     try:
         d = parse_with_custom_user_agent(url)
+        if d.get("status") == 304:
+            _next_due[url] = now + _feed_ttl.get(url, 0)
+            return _last_entries.get(url, [])
         if d.entries:
-            entry = d.entries[0]
-            # Decode HTML entities in title (e.g., &#8216; -> ', &#8230; -> …)
-            raw_title = entry.title.strip() if entry.get("title") else "No Title"
-            title = html.unescape(raw_title)
-            link = entry.link.strip() if entry.get("link") else ""
-            # Attempt to get publication time from 'published_parsed' or 'updated_parsed'
-            if entry.get("published_parsed"):
-                pub_time = time.mktime(entry.published_parsed)
-            elif entry.get("updated_parsed"):
-                pub_time = time.mktime(entry.updated_parsed)
-            else:
-                pub_time = 0
-            return title, link, pub_time
-        return None, None, 0
+            entries = [_entry_fields(entry) for entry in d.entries]
+            _last_entries[url] = entries
+            _feed_ttl[url] = _declared_ttl(d)
+            _next_due[url] = now + _feed_ttl[url]
+            return entries
+        return []
     except Exception as e:
         logging.error(f"[feed.py] Error fetching feed {url}: {e}")
-        return None, None, 0
+        return []
+
+def fetch_latest_article(url):
+    entries = _fetch_entries(url)
+    return entries[0] if entries else (None, None, 0)
+
+def fetch_new_articles(url, channel):
+    """Return every entry not yet posted to channel, newest first.
+
+    Feeds list newest-first, so the walk stops at the first link already
+    posted. A feed with no posting history in the channel only yields its
+    newest entry, so adding a feed doesn't flood the channel with its backlog.
+    """
+    new_entries = []
+    for title, link, pub_time in _fetch_entries(url, honor_ttl=True):
+        if is_link_posted(channel, link):
+            return new_entries
+        new_entries.append((title, link, pub_time))
+    return new_entries[:1]
 
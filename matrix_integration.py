@@ -1,140 +1,287 @@
 #!/usr/bin/env python3
 import asyncio
+import atexit
 import logging
 import time
 import json
 import fnmatch
-import requests
-import datetime
-import feedparser
+import re
 import os
-
-from nio import AsyncClient, RoomMessageText, LoginResponse
-from config import (
-    matrix_homeserver, matrix_user, matrix_password,
-    admins, admin as config_admin, admin_file, start_time
-)
+from collections import deque
+from functools import lru_cache
+
+from nio import AsyncClient, RoomMessageText, SyncError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+import config
+from config import matrix_homeserver, matrix_user, matrix_password
 import feed
-import persistence
 import users
-from commands import search_feeds, get_help
 from channels import load_channels
 
 
 logging.basicConfig(level=logging.INFO)
 
 GRACE_PERIOD = 5
-POSTED_FILE = "matrix_posted.json"
+# Delay between outbound messages; Matrix homeservers rate-limit at ~2 msg/s.
+SEND_INTERVAL = 0.5
+# Outbound messages beyond this many are dropped rather than queued without bound.
+# Feed announcements are the exception: the poller has already marked their
+# links posted, so they wait in an overflow list instead.
+OUTBOUND_QUEUE_SIZE = 256
+# At most this many queued messages are sent per round, different rooms in parallel.
+SEND_BATCH = 32
+# Commands from one sync are handled concurrently, at most this many at a time.
+MAX_CONCURRENT_COMMANDS = 32
+# Startup joins run concurrently, but no more than this many in flight (rate limits).
+MAX_CONCURRENT_JOINS = 8
 ROOM_NAMES_FILE = "matrix_room_names.json"
-
-# --- Per-Room Posted Feeds Storage ---
-def load_posted_articles():
-    if os.path.exists(POSTED_FILE):
-        try:
-            with open(POSTED_FILE, "r") as f:
-                data = json.load(f)
-                return {room: set(links) for room, links in data.items()}
-        except Exception as e:
-            logging.error(f"Error loading {POSTED_FILE}: {e}")
-            return {}
-    return {}
-
-def save_posted_articles(posted_dict):
+DM_ROOMS_FILE = "matrix_dm_rooms.json"
+# Newly discovered DM rooms are saved this long after the first change (seconds).
+DM_ROOMS_FLUSH_DELAY = 5
+
+# Feed announcements carry their URL on a line of its own starting "Link:".
+_LINK_LINE_RE = re.compile(r"^Link:(.*)$", re.MULTILINE)
+
+def _dumps(obj):
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _loads(data):
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _write_atomic(path, data):
+    """Write bytes to a temp file and rename it over path."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+# Lower-cased localparts of global admins; rebuilt by refresh_admins() after !reload.
+_ADMIN_SET = frozenset()
+
+def refresh_admins():
+    global _ADMIN_SET
+    _ADMIN_SET = frozenset(a.lower() for a in config.admins) | {config.admin.lower()}
+
+refresh_admins()
+
+# Set by start_matrix_bot(); other threads reach the bot (and its loop) through this.
+matrix_bot_instance = None
+
+def _enqueue_threadsafe(room, message, bypass_posted_check):
+    """Hand a message to the bot's loop from another thread; False if the bot isn't running."""
+    bot = matrix_bot_instance
+    if bot is None or bot.loop is None or bot.loop.is_closed():
+        return False
     try:
-        # Keep only the most recent 500 links per room to prevent unbounded growth
-        MAX_LINKS_PER_ROOM = 500
-        serializable = {}
-        for room, links in posted_dict.items():
-            link_list = list(links)
-            if len(link_list) > MAX_LINKS_PER_ROOM:
-                link_list = link_list[-MAX_LINKS_PER_ROOM:]
-            serializable[room] = link_list
-        with open(POSTED_FILE, "w") as f:
-            json.dump(serializable, f, indent=4)
-    except Exception as e:
-        logging.error(f"Error saving {POSTED_FILE}: {e}")
-# --- End Per-Room Posted Feeds Storage ---
+        bot.loop.call_soon_threadsafe(bot.enqueue, room, message, bypass_posted_check)
+    except RuntimeError:
+        # The loop closed between the check and the call.
+        return False
+    return True
 
 matrix_room_names = {}
 
 def load_room_names():
     """Load room names from file"""
     global matrix_room_names
-    if os.path.exists(ROOM_NAMES_FILE):
-        try:
-            with open(ROOM_NAMES_FILE, "r") as f:
-                matrix_room_names = json.load(f)
-                logging.info(f"Loaded {len(matrix_room_names)} room names from file")
-        except Exception as e:
-            logging.error(f"Error loading room names: {e}")
-            matrix_room_names = {}
+    try:
+        with open(ROOM_NAMES_FILE, "r") as f:
+            matrix_room_names = json.load(f)
+            logging.info("Loaded %s room names from file", len(matrix_room_names))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.error("Error loading room names: %s", e)
+        matrix_room_names = {}
 
 def save_room_names():
     """Save room names to file"""
     try:
-        with open(ROOM_NAMES_FILE, "w") as f:
-            json.dump(matrix_room_names, f, indent=4)
-        logging.info(f"Saved {len(matrix_room_names)} room names to file")
+        _write_atomic(ROOM_NAMES_FILE, _dumps(matrix_room_names))
+        logging.info("Saved %s room names to file", len(matrix_room_names))
     except Exception as e:
-        logging.error(f"Error saving room names: {e}")
+        logging.error("Error saving room names: %s", e)
+
+@lru_cache(maxsize=256)
+def _glob_match(pattern):
+    """Compiled matcher for a glob pattern, built once per distinct pattern."""
+    return re.compile(fnmatch.translate(pattern)).match
 
 def match_feed(feed_dict, pattern):
     if "*" in pattern or "?" in pattern:
-        matches = [name for name in feed_dict.keys() if fnmatch.fnmatch(name, pattern)]
+        match = _glob_match(pattern)
+        matches = [name for name in feed_dict if match(name)]
         return matches[0] if len(matches) == 1 else (matches if matches else None)
     return pattern if pattern in feed_dict else None
 
+# Normalized room key -> actual feed.channel_feeds key, rebuilt whenever the
+# channel_feeds dict is replaced or gains/loses rooms.
+_norm_index_cache = {"ver": None, "map": {}}
+
+@lru_cache(maxsize=1024)
+def _norm_room(room):
+    return room.lstrip("#!").lower()
+
 def get_feeds_for_room(room):
     feeds = feed.channel_feeds.get(room)
     if feeds is not None:
         return feeds
-    norm = room.lstrip("#!").lower()
-    for key, val in feed.channel_feeds.items():
-        if key.lstrip("#!").lower() == norm:
-            return val
-    return {}
-
+    ver = (id(feed.channel_feeds), len(feed.channel_feeds))
+    if _norm_index_cache["ver"] != ver:
+        index = {}
+        for key in feed.channel_feeds:
+            index.setdefault(_norm_room(key), key)
+        _norm_index_cache["map"] = index
+        _norm_index_cache["ver"] = ver
+    key = _norm_index_cache["map"].get(_norm_room(room))
+    return feed.channel_feeds.get(key, {}) if key is not None else {}
+
+@lru_cache(maxsize=4096)
 def get_localpart(matrix_id):
     if matrix_id.startswith("@"):
         return matrix_id.split(":", 1)[0].lstrip("@")
     return matrix_id
 
 # --- Matrix DM Helper Functions ---
+# user ID -> DM room ID, cached on disk so known users skip the m.direct lookup.
 matrix_dm_rooms = {}
+_dm_rooms_dirty = False
+
+def load_dm_rooms():
+    global matrix_dm_rooms
+    try:
+        with open(DM_ROOMS_FILE, "rb") as f:
+            matrix_dm_rooms = _loads(f.read())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.error("Error loading %s: %s", DM_ROOMS_FILE, e)
 
-async def update_direct_messages(room_id, user):
+def save_dm_rooms(rooms):
+    try:
+        _write_atomic(DM_ROOMS_FILE, _dumps(rooms))
+    except Exception as e:
+        logging.error("Error saving %s: %s", DM_ROOMS_FILE, e)
+
+def _remember_dm_room(user, room_id):
+    """Cache a DM room and schedule one coalesced save; call on the bot's loop."""
+    global _dm_rooms_dirty
+    matrix_dm_rooms[user] = room_id
+    if not _dm_rooms_dirty:
+        _dm_rooms_dirty = True
+        asyncio.get_running_loop().call_later(DM_ROOMS_FLUSH_DELAY, _flush_dm_rooms)
+
+def _flush_dm_rooms():
+    global _dm_rooms_dirty
+    _dm_rooms_dirty = False
+    asyncio.get_running_loop().run_in_executor(None, save_dm_rooms, dict(matrix_dm_rooms))
+
+def flush_dm_rooms():
+    """Save a pending DM room change now instead of waiting for the delayed save."""
+    global _dm_rooms_dirty
+    if _dm_rooms_dirty:
+        _dm_rooms_dirty = False
+        save_dm_rooms(dict(matrix_dm_rooms))
+
+# The delayed save runs on the bot's loop, which won't get to it at exit.
+atexit.register(flush_dm_rooms)
+
+# Last m.direct account data seen, so DM lookups and updates don't re-fetch it
+# from the homeserver each time. Other clients can change m.direct too, so the
+# copy is only trusted for M_DIRECT_TTL seconds.
+M_DIRECT_TTL = 300
+_m_direct = None
+_m_direct_at = 0.0
+
+async def _load_m_direct(force=False):
+    """Return the m.direct content dict, from cache unless stale; None on error."""
+    global _m_direct, _m_direct_at
+    if not force and _m_direct is not None and time.monotonic() - _m_direct_at < M_DIRECT_TTL:
+        return _m_direct
     try:
         dm_data = await matrix_bot_instance.client.get_account_data("m.direct")
-        dm_content = dm_data.content if dm_data and hasattr(dm_data, "content") else {}
     except Exception as e:
-        logging.error(f"Error fetching m.direct account data: {e}")
-        dm_content = {}
-    if user not in dm_content:
-        dm_content[user] = []
-    if room_id not in dm_content[user]:
-        dm_content[user].append(room_id)
+        logging.error("Error fetching m.direct account data: %s", e)
+        return None
+    _m_direct = dict(dm_data.content) if dm_data and hasattr(dm_data, "content") else {}
+    _m_direct_at = time.monotonic()
+    return _m_direct
+
+# New DM rooms are added to m.direct in batches: the first one starts a
+# flush DIRECT_FLUSH_DELAY seconds later that merges everything pending into a
+# single get/set of the account data. A failed flush puts its rooms back and
+# tries again DIRECT_RETRY_DELAY seconds later.
+DIRECT_FLUSH_DELAY = 1
+DIRECT_RETRY_DELAY = 30
+_pending_direct = {}
+_direct_flush_task = None
+
+def _schedule_direct_flush(delay=DIRECT_FLUSH_DELAY):
+    global _direct_flush_task
+    if _direct_flush_task is None:
+        _direct_flush_task = asyncio.create_task(_flush_direct_messages(delay))
+
+def _requeue_direct(pending):
+    for user, room_ids in pending.items():
+        _pending_direct.setdefault(user, []).extend(room_ids)
+    _schedule_direct_flush(DIRECT_RETRY_DELAY)
+
+def update_direct_messages(room_id, user):
+    """Queue room_id as a DM room for user in m.direct; call on the bot's loop."""
+    _pending_direct.setdefault(user, []).append(room_id)
+    _schedule_direct_flush()
+
+async def _flush_direct_messages(delay):
+    global _pending_direct, _direct_flush_task, _m_direct
+    await asyncio.sleep(delay)
+    pending, _pending_direct = _pending_direct, {}
+    _direct_flush_task = None
+    # Merge into a fresh copy: writing a stale or empty m.direct back would
+    # drop DM rooms other clients have added.
+    dm_content = await _load_m_direct(force=True)
+    if dm_content is None:
+        # Keep the rooms for a retry rather than write m.direct blind.
+        _requeue_direct(pending)
+        return
+    changed = False
+    for user, room_ids in pending.items():
+        rooms = dm_content.setdefault(user, [])
+        for room_id in room_ids:
+            if room_id not in rooms:
+                rooms.append(room_id)
+                changed = True
+    if changed:
         try:
             await matrix_bot_instance.client.set_account_data("m.direct", dm_content)
-            logging.info(f"Updated m.direct for {user} with room {room_id}")
+            logging.info("Updated m.direct for %s user(s)", len(pending))
         except Exception as e:
-            logging.error(f"Error setting m.direct account data: {e}")
+            _m_direct = None
+            logging.error("Error setting m.direct account data: %s", e)
+            _requeue_direct(pending)
 
 async def get_dm_room(user):
-    global matrix_dm_rooms
     if user in matrix_dm_rooms:
         return matrix_dm_rooms[user]
-    try:
-        dm_data = await matrix_bot_instance.client.get_account_data("m.direct")
-        if dm_data and hasattr(dm_data, "content"):
-            content = dm_data.content
-            if user in content and content[user]:
-                room_id = content[user][0]
-                matrix_dm_rooms[user] = room_id
-                logging.info(f"Found existing DM room for {user}: {room_id}")
-                return room_id
-    except Exception as e:
-        logging.error(f"Error retrieving m.direct for DM: {e}")
-    
+    content = await _load_m_direct()
+    if content and content.get(user):
+        room_id = content[user][0]
+        _remember_dm_room(user, room_id)
+        logging.info("Found existing DM room for %s: %s", user, room_id)
+        return room_id
+
     try:
         response = await matrix_bot_instance.client.room_create(
             invite=[user],
@@ -143,43 +290,28 @@ async def get_dm_room(user):
         )
         room_id = getattr(response, "room_id", None)
         if room_id and room_id.startswith("!"):
-            matrix_dm_rooms[user] = room_id
-            logging.info(f"Created DM room for {user}: {room_id}")
+            _remember_dm_room(user, room_id)
+            logging.info("Created DM room for %s: %s", user, room_id)
             try:
                 await matrix_bot_instance.client.room_set_encryption(room_id, algorithm="m.megolm.v1.aes-sha2")
-                logging.info(f"Enabled encryption in DM room {room_id}")
+                logging.info("Enabled encryption in DM room %s", room_id)
             except Exception as e:
-                logging.error(f"Failed to enable encryption in DM room {room_id}: {e}")
-            await update_direct_messages(room_id, user)
+                logging.error("Failed to enable encryption in DM room %s: %s", room_id, e)
+            update_direct_messages(room_id, user)
             return room_id
         else:
-            logging.error(f"Failed to create DM room for {user}: {response}")
+            logging.error("Failed to create DM room for %s: %s", user, response)
             return None
     except Exception as e:
-        logging.error(f"Exception creating DM room for {user}: {e}")
+        logging.error("Exception creating DM room for %s: %s", user, e)
         return None
 
-async def send_matrix_dm_async(user, message):
-    room_id = await get_dm_room(user)
-    if room_id:
-        try:
-            await matrix_bot_instance.client.room_send(
-                room_id,
-                message_type="m.room.message",
-                content={"msgtype": "m.text", "body": message}
-            )
-            logging.info(f"Sent DM to {user} in room {room_id}")
-        except Exception as e:
-            logging.error(f"Failed to send DM to {user} in room {room_id}: {e}")
-
 def send_matrix_dm(user, message):
-    global matrix_bot_instance, matrix_event_loop
-    if matrix_bot_instance is None or matrix_event_loop is None:
-        logging.error("Matrix bot not properly initialized for DM sending.")
-        return
-    matrix_event_loop.call_soon_threadsafe(
-        lambda: asyncio.ensure_future(send_matrix_dm_async(user, message), loop=matrix_event_loop)
-    )
+    """Queue a DM to a Matrix user ID from another thread."""
+    # DMs go through the same outbound queue as room messages. Subscription
+    # DMs were never deduplicated, so keep bypassing the posted-link check.
+    if not _enqueue_threadsafe(user, message, True):
+        logging.error("Matrix bot not running; can't send DM to %s.", user)
 # --- End Matrix DM Helper Functions ---
 
 class MatrixBot:
@@ -187,10 +319,14 @@ class MatrixBot:
         self.client = AsyncClient(homeserver, user)
         self.password = password
         self.start_time = 0
+        self.loop = None
         self.processing_enabled = False
-        self.posted_articles = load_posted_articles()
         self.client.add_event_callback(self.message_callback, RoomMessageText)
         self.last_help_timestamp = {}
+        self.outbound = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._overflow = deque()
+        self._command_sem = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+        self._command_tasks = set()
 
     async def login(self):
         response = await self.client.login(self.password, device_name="FuzzyFeeds Bot")
@@ -201,28 +337,33 @@ class MatrixBot:
             raise Exception("Matrix login failed")
 
     async def join_rooms(self):
-        global matrix_room_names
+        loop = asyncio.get_running_loop()
         # Load existing room names first
-        load_room_names()
+        await loop.run_in_executor(None, load_room_names)
         
-        channels_data = load_channels()
+        channels_data = await loop.run_in_executor(None, load_channels)
         matrix_channels = channels_data.get("matrix_channels", [])
-        for room in matrix_channels:
-            try:
-                response = await self.client.join(room)
-                if hasattr(response, "room_id"):
-                    # Try multiple methods to get room name
-                    display_name = await self.get_room_display_name(room)
-                    matrix_room_names[room] = display_name
-                    logging.info(f"Joined Matrix room: {room} (Display name: {display_name})")
-                    # Announcement removed per request.
-                else:
-                    logging.error(f"Error joining room {room}: {response}")
-            except Exception as e:
-                logging.error(f"Exception joining room {room}: {e}")
+        # Join all rooms concurrently so startup costs one round trip, not one per room
+        join_slots = asyncio.Semaphore(MAX_CONCURRENT_JOINS)
+        await asyncio.gather(*(self._join_one(room, join_slots) for room in matrix_channels), return_exceptions=True)
         
         # Save updated room names
-        save_room_names()
+        await loop.run_in_executor(None, save_room_names)
+
+    async def _join_one(self, room, join_slots):
+        try:
+            async with join_slots:
+                response = await self.client.join(room)
+            if hasattr(response, "room_id"):
+                # Try multiple methods to get room name
+                display_name = await self.get_room_display_name(room)
+                matrix_room_names[room] = display_name
+                logging.info("Joined Matrix room: %s (Display name: %s)", room, display_name)
+                # Announcement removed per request.
+            else:
+                logging.error("Error joining room %s: %s", room, response)
+        except Exception as e:
+            logging.error("Exception joining room %s: %s", room, e)
 
     async def get_room_display_name(self, room_id):
         """Try multiple methods to get a readable room name in #roomname:domain format"""
@@ -236,7 +377,7 @@ class MatrixBot:
                     alias = "#" + alias
                 return alias
         except Exception as e:
-            logging.debug(f"Could not fetch canonical alias for {room_id}: {e}")
+            logging.debug("Could not fetch canonical alias for %s: %s", room_id, e)
         
         try:
             # Method 2: Try to get any available aliases
@@ -250,7 +391,7 @@ class MatrixBot:
                         alias = "#" + alias
                     return alias
         except Exception as e:
-            logging.debug(f"Could not fetch aliases for {room_id}: {e}")
+            logging.debug("Could not fetch aliases for %s: %s", room_id, e)
         
         try:
             # Method 3: Try to get the m.room.name state event and format it properly
@@ -263,10 +404,10 @@ class MatrixBot:
                     return f"#{room_name}:{domain}"
                 return f"#{room_name}"
         except Exception as e:
-            logging.debug(f"Could not fetch m.room.name for {room_id}: {e}")
+            logging.debug("Could not fetch m.room.name for %s: %s", room_id, e)
         
         # Fallback: return the room ID itself
-        logging.warning(f"Could not determine display name for {room_id}, using room ID")
+        logging.warning("Could not determine display name for %s, using room ID", room_id)
         return room_id
 
     async def initial_sync(self):
@@ -281,116 +422,203 @@ class MatrixBot:
         room_key = room.room_id
         parts = command.strip().split(" ", 2)
         cmd = parts[0].lower()
-        if hasattr(room, "origin_server_ts") and room.origin_server_ts < self.start_time:
-            logging.info(f"Ignoring old message in {room_key}: {command}")
-            return
-        logging.info(f"Processing command `{cmd}` from `{sender}` in `{room_key}`.")
+        logging.info("Processing command `%s` from `%s` in `%s`.", cmd, sender, room_key)
+        # The shared handler does blocking HTTP and file I/O, so it runs in the
+        # default executor; replies hop back onto the loop to be queued.
+        loop = asyncio.get_running_loop()
         def matrix_send(target, msg):
-            asyncio.create_task(self.send_message(target, msg))
+            loop.call_soon_threadsafe(self.enqueue, target, msg)
         def matrix_send_private(user_, msg):
-            asyncio.create_task(self.send_message(room_key, msg))
-        def matrix_send_multiline(target, msg):
-            asyncio.create_task(self.send_message(target, msg))
-        sender_localpart = get_localpart(sender).lower()
-        is_op_flag = (sender_localpart in ([a.lower() for a in admins] + [config_admin.lower()]))
+            loop.call_soon_threadsafe(self.enqueue, room_key, msg)
+        matrix_send_multiline = matrix_send
+        is_op_flag = get_localpart(sender).lower() in _ADMIN_SET
         from commands import handle_centralized_command
-        handle_centralized_command("matrix", matrix_send, matrix_send_private, matrix_send_multiline, sender, room_key, command, is_op_flag)
+        try:
+            await loop.run_in_executor(
+                None, handle_centralized_command, "matrix", matrix_send, matrix_send_private,
+                matrix_send_multiline, sender, room_key, command, is_op_flag
+            )
+        except Exception as e:
+            logging.error("Error handling Matrix command %s: %s", cmd, e)
 
     async def message_callback(self, room, event):
         if not self.processing_enabled:
             return
-        if hasattr(event, "origin_server_ts") and event.origin_server_ts < self.start_time:
-            logging.info(f"Ignoring old message in {room.room_id}: {event.body}")
+        # Cheapest, most selective check first: almost all traffic is chatter.
+        body = event.body
+        if not body or body[0] != "!":
+            return
+        # nio exposes the event's origin_server_ts as server_timestamp.
+        if getattr(event, "server_timestamp", self.start_time) < self.start_time:
+            logging.info("Ignoring old message in %s: %s", room.room_id, body)
             return
-        if event.body.startswith("!"):
-            logging.info(f"Matrix command received in {room.room_id}: {event.body}")
-            await self.process_command(room, event.body, event.sender)
+        logging.info("Matrix command received in %s: %s", room.room_id, body)
+        # Don't hold up the rest of the sync batch; keep a reference so the task isn't collected.
+        task = asyncio.create_task(self._run_command(room, body, event.sender))
+        self._command_tasks.add(task)
+        task.add_done_callback(self._command_tasks.discard)
+
+    async def _run_command(self, room, command, sender):
+        async with self._command_sem:
+            await self.process_command(room, command, sender)
 
     async def send_message(self, room_id, message, bypass_posted_check=False):
-        link = None
-        for line in message.splitlines():
-            if line.startswith("Link:"):
-                link = line[len("Link:"):].strip()
-                break
-        if link and not bypass_posted_check:
+        # A user ID means a DM; find or create the DM room first.
+        if room_id.startswith("@"):
+            user = room_id
+            room_id = await get_dm_room(user)
+            if not room_id:
+                logging.error("No DM room available for %s", user)
+                return
+        # Only feed announcements carry a "Link:" line; a substring test lets
+        # command replies and notices skip the regex and dedup entirely.
+        if "Link:" in message:
+            m = _LINK_LINE_RE.search(message)
+            if m:
+                await self.send_feed_link(room_id, m.group(1).strip(), message, bypass_posted_check)
+                return
+        await self._raw_send(room_id, message)
+
+    async def send_feed_link(self, room_id, link, message, bypass_posted_check=False):
+        """Send a feed announcement unless link was already posted to room_id."""
+        if not bypass_posted_check:
             # Use database for dedup instead of JSON files
             try:
                 from database import get_db
                 db = get_db()
                 if db.is_link_posted_to_channel(link, room_id):
-                    logging.info(f"Link already posted in {room_id}: {link}")
+                    logging.info("Link already posted in %s: %s", room_id, link)
                     return
             except Exception as e:
-                logging.debug(f"DB dedup check failed, proceeding: {e}")
+                logging.debug("DB dedup check failed, proceeding: %s", e)
+        await self._raw_send(room_id, message)
+
+    async def _raw_send(self, room_id, message):
         try:
             await self.client.room_send(
                 room_id,
                 message_type="m.room.message",
                 content={"msgtype": "m.text", "body": message}
             )
-            logging.info(f"Sent message to {room_id}: {message}")
+            logging.info("Sent message to %s: %s", room_id, message)
         except Exception as e:
-            logging.error(f"Failed to send message to {room_id}: {e}")
+            logging.error("Failed to send message to %s: %s", room_id, e)
+
+    def enqueue(self, room_id, message, bypass_posted_check=False):
+        """Queue a message for the sender task; must be called on the bot's loop."""
+        item = (room_id, message, bypass_posted_check)
+        is_announcement = "Link:" in message
+        # Announcements queue behind any already in overflow to keep their order.
+        if not (is_announcement and self._overflow):
+            try:
+                self.outbound.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                pass
+        if is_announcement:
+            self._overflow.append(item)
+        else:
+            logging.warning("Matrix outbound queue full, dropping message for %s", room_id)
+
+    async def send_many(self, items):
+        """Send (room_id, message, bypass_posted_check) items; rooms run concurrently, each in order."""
+        by_room = {}
+        for item in items:
+            by_room.setdefault(item[0], []).append(item)
+
+        async def send_room(room_items):
+            for room_id, message, bypass_posted_check in room_items:
+                await self.send_message(room_id, message, bypass_posted_check)
+
+        results = await asyncio.gather(*(send_room(v) for v in by_room.values()), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error("Error sending Matrix batch: %s", result)
+
+    async def _sender(self):
+        """Deliver queued messages in rounds of up to SEND_BATCH."""
+        while True:
+            batch = [await self.outbound.get()]
+            while len(batch) < SEND_BATCH and not self.outbound.empty():
+                batch.append(self.outbound.get_nowait())
+            # Move waiting announcements into the room this batch just freed.
+            while self._overflow and not self.outbound.full():
+                self.outbound.put_nowait(self._overflow.popleft())
+            await self.send_many(batch)
+            await asyncio.sleep(SEND_INTERVAL)
 
     async def sync_forever(self):
         logging.info("Starting Matrix sync loop...")
+        # sync() long-polls for up to 30s, so only back off after failures.
+        errors = 0
         while True:
             try:
-                await self.client.sync(timeout=30000)
+                response = await self.client.sync(timeout=30000)
+                if isinstance(response, SyncError):
+                    raise Exception(response)
+                errors = 0
             except Exception as e:
-                logging.error(f"Matrix sync error: {e}")
-            await asyncio.sleep(1)
+                errors += 1
+                logging.error("Matrix sync error: %s", e)
+                await asyncio.sleep(min(30, 2 ** errors))
 
     async def run(self):
-        feed.load_feeds()
-        users.load_users()
-        logging.info(f"Loaded feeds: {feed.channel_feeds}")
+        self.loop = asyncio.get_running_loop()
+        logging.info("Matrix event loop: %s.%s", type(self.loop).__module__, type(self.loop).__name__)
+        # Startup file loads run in the executor, off the loop.
+        await self.loop.run_in_executor(None, feed.load_feeds)
+        await self.loop.run_in_executor(None, users.load_users)
+        await self.loop.run_in_executor(None, load_dm_rooms)
+        logging.info("Loaded feeds: %s", feed.channel_feeds)
         await self.login()
+        self._sender_task = asyncio.create_task(self._sender())
         await self.join_rooms()
         await self.initial_sync()
         await self.sync_forever()
 
 def send_matrix_message(room, message, bypass_posted_check=False):
-    global matrix_bot_instance, matrix_event_loop
-    if matrix_bot_instance is None:
-        logging.error("Matrix bot instance not initialized.")
-        return
-    if matrix_event_loop is None:
-        logging.error("Matrix event loop not available.")
-        return
-    matrix_event_loop.call_soon_threadsafe(
-        lambda: asyncio.ensure_future(
-            matrix_bot_instance.send_message(room, message, bypass_posted_check),
-            loop=matrix_event_loop
-        )
-    )
+    """
+    Queue a message from another thread.
+    Sends go through the bot's bounded outbound queue, so bursts from the
+    poller are serialized and rate limited instead of piling up as tasks.
+    """
+    if not _enqueue_threadsafe(room, message, bypass_posted_check):
+        logging.error("Matrix bot not running; can't send message to %s.", room)
 
 # Export send_matrix_message for legacy compatibility.
 send_message = send_matrix_message
 
+async def _run_matrix_bot():
+    global matrix_bot_instance
+    # Build the bot inside the running loop so its client and queue bind to it.
+    bot_instance = MatrixBot(matrix_homeserver, matrix_user, matrix_password)
+    matrix_bot_instance = bot_instance
+    await bot_instance.run()
+
 def start_matrix_bot():
     """
     Initializes and runs the Matrix bot.
-    This function schedules the bot's run() coroutine and then runs the event loop forever.
+    Blocks on its own event loop (uvloop if installed) for as long as the bot is running.
     """
-    global matrix_bot_instance, matrix_event_loop
-    loop = asyncio.new_event_loop()
-    matrix_event_loop = loop
-    asyncio.set_event_loop(loop)
+    global matrix_bot_instance
     logging.info("Starting Matrix integration...")
     channels_data = load_channels()
     matrix_channels = channels_data.get("matrix_channels", [])
     for room in matrix_channels:
         if room not in feed.channel_feeds:
             feed.channel_feeds[room] = {}
-    bot_instance = MatrixBot(matrix_homeserver, matrix_user, matrix_password)
-    matrix_bot_instance = bot_instance
+    # A loop for this thread only; installing uvloop's policy would change
+    # the loop every other integration gets too.
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     try:
-        loop.create_task(bot_instance.run())
-        loop.run_forever()
+        loop.run_until_complete(_run_matrix_bot())
     except Exception as e:
-        logging.error(f"Matrix integration error: {e}")
-        loop.stop()
+        logging.error("Matrix integration error: %s", e)
+    finally:
+        # Senders on other threads check for this before touching the loop.
+        matrix_bot_instance = None
+        loop.close()
 
 def disable_feed_loop():
     # No-op function for compatibility.
@@ -34,14 +34,14 @@ for plain_key, composite_key in mappings.items():
 # Merge posted links similarly
 for plain_key, composite_key in mappings.items():
     if plain_key in posted_links:
-        if composite_key not in posted_links:
-            posted_links[composite_key] = posted_links[plain_key]
+        plain = posted_links.pop(plain_key)
+        existing = posted_links.get(composite_key)
+        if not existing:
+            posted_links[composite_key] = plain
         else:
-            # Add unique links only
-            combined = set(posted_links[composite_key])
-            combined.update(posted_links[plain_key])
-            posted_links[composite_key] = list(combined)
-        del posted_links[plain_key]
+            # Append only unseen links, keeping the existing order.
+            seen = set(existing)
+            existing.extend(x for x in plain if not (x in seen or seen.add(x)))
 
 # Save cleaned files
 with open("feeds.json", "w") as f:
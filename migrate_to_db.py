@@ -7,60 +7,86 @@ Run this once to migrate existing data
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from database import get_db
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Channel key -> platform: !room (matrix), all digits (discord), @name or
+# -12345 (telegram). Anything else is an IRC channel.
+_PLATFORM_RE = re.compile(r'^(?:(?P<matrix>!)|(?P<discord>\d+$)|(?P<telegram>@|-\d+$))')
+
+# Files at least this large are streamed with ijson (when installed) instead
+# of being loaded whole; years of posted_links.json can run to hundreds of MB.
+STREAM_THRESHOLD = 16 * 1024 * 1024
+
 def load_json_file(filename):
     """Load a JSON file safely"""
     filepath = os.path.join(BASE_DIR, filename)
-    if not os.path.exists(filepath):
-        logging.warning(f"File not found: {filename}")
-        return {}
-
     try:
         with open(filepath, 'r') as f:
             return json.load(f)
+    except FileNotFoundError:
+        logging.warning(f"File not found: {filename}")
+        return {}
     except Exception as e:
         logging.error(f"Error loading {filename}: {e}")
         return {}
 
+def iter_json_items(filename):
+    """Yield the top-level (key, value) pairs of a JSON object file"""
+    filepath = os.path.join(BASE_DIR, filename)
+    try:
+        size = os.path.getsize(filepath)
+    except OSError:
+        size = 0  # missing; load_json_file reports it
+    if ijson is None or size < STREAM_THRESHOLD:
+        yield from load_json_file(filename).items()
+        return
+
+    try:
+        with open(filepath, 'rb') as f:
+            yield from ijson.kvitems(f, '')
+    except Exception as e:
+        logging.error(f"Error streaming {filename}: {e}")
+
 def migrate_feeds():
     """Migrate feeds from feeds.json to database"""
     logging.info("Migrating feeds...")
 
-    feeds_data = load_json_file('feeds.json')
     db = get_db()
 
+    # Plain IRC channel names are assumed to be on the default server from config
+    try:
+        from config import server as default_server
+    except:
+        default_server = "unknown"
+
     migrated = 0
-    for channel, feeds in feeds_data.items():
-        # Determine platform from channel format
-        if channel.startswith('!'):
-            platform = 'matrix'
-        elif channel.isdigit():
-            platform = 'discord'
-        elif channel.startswith('@') or (channel.startswith('-') and channel[1:].isdigit()):
-            platform = 'telegram'
-        elif '|' in channel:
-            platform = 'irc'
-            channel = channel  # Keep composite format
-        else:
-            platform = 'irc'
-            # Assume default server from config
-            try:
-                from config import server as default_server
-                channel = f"{default_server}|{channel}"
-            except:
-                channel = f"unknown|{channel}"
-
-        for feed_name, feed_url in feeds.items():
-            feed_id = db.add_feed(feed_name, feed_url, channel, platform)
-            if feed_id:
-                migrated += 1
-                logging.info(f"Migrated feed: {feed_name} -> {channel} ({platform})")
+    with db.batch(fast_sync=True):
+        for channel, feeds in iter_json_items('feeds.json'):
+            # Determine platform from channel format
+            m = _PLATFORM_RE.match(channel)
+            if m:
+                platform = m.lastgroup
+            else:
+                platform = 'irc'
+                if '|' not in channel:
+                    channel = f"{default_server}|{channel}"
+
+            for feed_name, feed_url in feeds.items():
+                feed_id = db.add_feed(feed_name, feed_url, channel, platform)
+                if feed_id:
+                    migrated += 1
+                    logging.info(f"Migrated feed: {feed_name} -> {channel} ({platform})")
 
     logging.info(f"Migrated {migrated} feeds")
     return migrated
@@ -69,37 +95,25 @@ def migrate_posted_links():
     """Migrate posted links from posted_links.json to feed history"""
     logging.info("Migrating posted links...")
 
-    posted_data = load_json_file('posted_links.json')
     db = get_db()
 
     migrated = 0
-    for channel, links in posted_data.items():
-        # Get all feeds for this channel
-        feeds = db.get_feeds(channel=channel, active_only=False)
-
-        # If we can't determine which feed posted it, create a generic entry
-        for link in links:
-            # Try to match link to a feed (basic heuristic)
-            feed_id = None
-            for feed in feeds:
-                # This is a simple match - you might want more sophisticated logic
-                if feed_id is None:
-                    feed_id = feed['id']
-                    break
-
-            if feed_id:
-                # Add to history (will skip if already exists)
-                try:
-                    db.add_to_history(
-                        feed_id=feed_id,
-                        title="Migrated from posted_links.json",
-                        link=link,
-                        channel=channel,
-                        platform=feeds[0]['platform'] if feeds else 'unknown'
-                    )
-                    migrated += 1
-                except:
-                    pass
+    with db.batch(fast_sync=True):
+        for channel, links in iter_json_items('posted_links.json'):
+            # Get all feeds for this channel
+            feeds = db.get_feeds(channel=channel, active_only=False)
+
+            # We can't tell which feed posted each link, so attribute them
+            # all to the channel's first feed
+            if not feeds:
+                continue
+            migrated += db.add_many_to_history(
+                feed_id=feeds[0]['id'],
+                links=links,
+                title="Migrated from posted_links.json",
+                channel=channel,
+                platform=feeds[0]['platform']
+            )
 
     logging.info(f"Migrated {migrated} posted links to history")
     return migrated
@@ -114,30 +128,31 @@ def migrate_subscriptions():
     migrated_users = 0
     migrated_feeds = 0
 
-    for username, feeds in subs_data.items():
-        # Determine platform from username format
-        if username.startswith('@') and ':' in username:
-            platform = 'matrix'
-            user_id = username
-        elif username.startswith('@'):
-            platform = 'telegram'
-            user_id = username
-        elif username.isdigit():
-            platform = 'discord'
-            user_id = username
-        else:
-            platform = 'irc'
-            user_id = username
-
-        # Add user to database
-        db_user_id = db.add_user(username, platform, user_id)
-        migrated_users += 1
-
-        # Add their feed subscriptions as personal feeds
-        for feed_name, feed_url in feeds.items():
-            feed_id = db.add_feed(feed_name, feed_url, f"user_{username}", platform)
-            if feed_id:
-                migrated_feeds += 1
+    with db.batch(fast_sync=True):
+        for username, feeds in subs_data.items():
+            # Determine platform from username format
+            if username.startswith('@') and ':' in username:
+                platform = 'matrix'
+                user_id = username
+            elif username.startswith('@'):
+                platform = 'telegram'
+                user_id = username
+            elif username.isdigit():
+                platform = 'discord'
+                user_id = username
+            else:
+                platform = 'irc'
+                user_id = username
+
+            # Add user to database
+            db_user_id = db.add_user(username, platform, user_id)
+            migrated_users += 1
+
+            # Add their feed subscriptions as personal feeds
+            for feed_name, feed_url in feeds.items():
+                feed_id = db.add_feed(feed_name, feed_url, f"user_{username}", platform)
+                if feed_id:
+                    migrated_feeds += 1
 
     logging.info(f"Migrated {migrated_users} users with {migrated_feeds} personal feeds")
     return migrated_users, migrated_feeds
@@ -149,13 +164,8 @@ def set_default_schedules():
     db = get_db()
     feeds = db.get_feeds(active_only=True)
 
-    for feed in feeds:
-        # Default: 15 minutes, normal priority, no quiet hours
-        db.set_feed_schedule(
-            feed_id=feed['id'],
-            interval_seconds=900,
-            priority=0
-        )
+    # Default: 15 minutes, normal priority, no quiet hours
+    db.set_feed_schedules([feed['id'] for feed in feeds], interval_seconds=900, priority=0)
 
     logging.info(f"Set schedules for {len(feeds)} feeds")
 
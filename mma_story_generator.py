@@ -5,29 +5,376 @@ MMA Story Generator - Fetches new MMA stories, rewrites them, adds images, and c
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
 import time
+import calendar
 import re
 from datetime import datetime, timezone
 from urllib.parse import urlparse, quote
 from typing import Dict, List, Optional, Tuple
-import sys
 import os
+import tempfile
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 
-# Add image enhancement system
-sys.path.append('/home/snoopy/NewFuzzyFeeds')
+# Image enhancement system (lives alongside this module)
 from image_enhancement import find_mma_image
+from persistence import load_json, save_json
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Source links already turned into pages, oldest first, so later runs skip them
+SEEN_LINKS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mma_seen_links.json')
+MAX_SEEN_LINKS = 5000
+
+# Patterns used for every story, compiled once
+_RE_HTML_TAGS = re.compile(r'<[^>]+>')
+_RE_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_RE_SLUG_DASH = re.compile(r'[-\s]+')
+_RE_FIGHTER_PATTERNS = [
+    re.compile(r'(\w+\s+\w+)\s+(?:defeats|beats|submits|knocks out)\s+(\w+\s+\w+)', re.IGNORECASE),
+    re.compile(r'(\w+\s+\w+)\s+(?:vs\.?|v\.?)\s+(\w+\s+\w+)', re.IGNORECASE),
+    re.compile(r'(\w+\s+\w+)\s+(?:and|,)\s+(\w+\s+\w+)', re.IGNORECASE),
+]
+_RE_UFC_EVENT = re.compile(r'UFC\s+(\d+)', re.IGNORECASE)
+_RE_LOCATIONS = [
+    re.compile(r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'),
+    re.compile(r'at\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'),
+]
+# Promotions in priority order (first one named in a title wins), and one
+# case-insensitive scan that finds any of them
+_ORGS = ('UFC', 'Bellator', 'PFL', 'ONE Championship', 'BKFC')
+_RE_ORGS = re.compile('|'.join(map(re.escape, _ORGS)), re.IGNORECASE)
+# Story-type keywords match anywhere in the lower-cased title (plain substrings)
+_RE_FIGHT_KEYWORDS = re.compile('|'.join(map(re.escape, [
+    'defeats', 'beats', 'submits', 'knockout', 'ko', 'tko', 'decision', 'wins', 'victory'])))
+_RE_ANNOUNCEMENT_KEYWORDS = re.compile('|'.join(map(re.escape, [
+    'announces', 'signs', 'contract', 'retires', 'returns', 'suspended', 'released'])))
+
+# Only the newest few entries of each feed are used
+ENTRIES_PER_FEED = 3
+
+def _truncate_after_entries(content: bytes, count: int) -> bytes:
+    """Cut a feed document down to its first count entries.
+
+    Everything between the count-th entry and the end of the last one is
+    dropped; what follows the last entry (the closing channel/rss/feed tags)
+    is kept, so feedparser still sees a well-formed document and doesn't
+    parse hundreds of KB of entries that are thrown away. Documents that
+    don't use plain <item>/<entry> tags are returned unchanged.
+    """
+    for end_tag in (b'</item>', b'</entry>'):
+        pos = -1
+        for _ in range(count):
+            pos = content.find(end_tag, pos + 1)
+            if pos == -1:
+                break
+        if pos == -1:
+            continue
+        cut = pos + len(end_tag)
+        tail = content.rfind(end_tag) + len(end_tag)
+        return content[:cut] + content[tail:] if tail > cut else content
+    return content
+
+# The same story is often carried by several of the feeds; don't search for
+# its image more than once.
+@lru_cache(maxsize=256)
+def _cached_mma_image(title: str) -> Optional[str]:
+    return find_mma_image(title)
+
+# Story page template. Placeholders are string.Template ($name) so the
+# JS/CSS braces can be written as-is; a literal dollar sign is $$.
+_ASTRO_FIELDS = ('title', 'description', 'image', 'publishedTime', 'category',
+                 'tags', 'slug', 'author', 'fighters', 'organization')
+_ASTRO_TEMPLATE = Template('''---
+import Layout from '../../layouts/Layout.astro';
+import ShareBar from '../../components/ShareBar.astro';
+import ViewsCounter from '../../components/ViewsCounter.astro';
+
+const article = {
+  title: $title,
+  description: $description,
+  image: $image,
+  publishedTime: $publishedTime,
+  category: $category,
+  tags: $tags,
+  slug: $slug,
+  author: $author,
+  fighters: $fighters,
+  organization: $organization
+};
+
+const currentUrl = `https://testing.fightpulse.net/news/$${article.slug}`;
+const absoluteImageUrl = article.image.startsWith('http') 
+  ? article.image 
+  : `https://testing.fightpulse.net$${article.image}`;
+---
+
+<Layout 
+  title={`$${article.title} | FightPulse`}
+  description={article.description}
+  image={absoluteImageUrl}
+  canonical={currentUrl}
+  article={true}
+  publishedTime={article.publishedTime}
+  tags={article.tags}
+  category={article.category}
+>
+  <!-- Open Graph Meta Tags -->
+  <meta property="og:title" content={article.title} />
+  <meta property="og:description" content={article.description} />
+  <meta property="og:image" content={absoluteImageUrl} />
+  <meta property="og:url" content={currentUrl} />
+  <meta property="og:type" content="article" />
+  <meta property="og:site_name" content="FightPulse" />
+  <meta property="article:author" content={article.author} />
+  <meta property="article:published_time" content={article.publishedTime} />
+  <meta property="article:section" content={article.category} />
+  {article.tags.map(tag => (
+    <meta property="article:tag" content={tag} />
+  ))}
+  
+  <!-- Twitter Card Meta Tags -->
+  <meta name="twitter:card" content="summary_large_image" />
+  <meta name="twitter:title" content={article.title} />
+  <meta name="twitter:description" content={article.description} />
+  <meta name="twitter:image" content={absoluteImageUrl} />
+  
+  <!-- Additional SEO Meta Tags -->
+  <meta name="author" content={article.author} />
+  <meta name="robots" content="index, follow, max-snippet:-1, max-image-preview:large" />
+  <link rel="canonical" href={currentUrl} />
+
+  <div class="article-container">
+    <div class="container">
+      <article class="article-content">
+        <header class="article-header">
+          <div class="article-meta">
+            <span class="article-category">{article.category}</span>
+            <time class="article-date" datetime={article.publishedTime}>
+              {new Date(article.publishedTime).toLocaleDateString('en-US', { 
+                year: 'numeric', 
+                month: 'long', 
+                day: 'numeric' 
+              })}
+            </time>
+          </div>
+          <h1 class="article-title">{article.title}</h1>
+          <p class="article-description">{article.description}</p>
+        </header>
+
+        <div class="article-hero">
+          <img src={article.image} alt={article.title} class="article-image" loading="eager">
+        </div>
+
+        <div class="article-body">
+          $content
+          
+          {article.fighters.length > 0 && (
+            <div class="fighters-info">
+              <h3>Featured Fighters</h3>
+              <ul>
+                {article.fighters.map(fighter => (
+                  <li>{fighter}</li>
+                ))}
+              </ul>
+            </div>
+          )}
+          
+          <div class="article-footer">
+            <p><strong>Organization:</strong> {article.organization}</p>
+            <p><strong>Category:</strong> {article.category}</p>
+            <div class="article-tags">
+              {article.tags.map(tag => (
+                <span class="tag">{tag}</span>
+              ))}
+            </div>
+          </div>
+        </div>
+
+        <div class="article-actions">
+          <ViewsCounter slug={article.slug} />
+          <ShareBar 
+            title={article.title}
+            description={article.description}
+          />
+        </div>
+      </article>
+    </div>
+  </div>
+</Layout>
+
+<style>
+  .article-container {
+    padding: var(--fp-space-8) 0;
+    min-height: 100vh;
+  }
+
+  .article-content {
+    max-width: 800px;
+    margin: 0 auto;
+  }
+
+  .article-header {
+    text-align: center;
+    margin-bottom: var(--fp-space-8);
+  }
+
+  .article-meta {
+    display: flex;
+    justify-content: center;
+    gap: var(--fp-space-4);
+    margin-bottom: var(--fp-space-4);
+    font-size: var(--fp-text-sm);
+  }
+
+  .article-category {
+    background: var(--fp-primary);
+    color: white;
+    padding: 4px 12px;
+    border-radius: var(--fp-radius);
+    font-weight: var(--fp-font-semibold);
+  }
+
+  .article-date {
+    color: var(--fp-text-secondary);
+  }
+
+  .article-title {
+    font-size: var(--fp-text-4xl);
+    font-weight: var(--fp-font-bold);
+    color: var(--fp-text-primary);
+    margin-bottom: var(--fp-space-4);
+    line-height: 1.2;
+  }
+
+  .article-description {
+    font-size: var(--fp-text-lg);
+    color: var(--fp-text-secondary);
+    line-height: 1.6;
+  }
+
+  .article-hero {
+    margin: var(--fp-space-8) 0 var(--fp-space-12) 0;
+    padding: 0 var(--fp-space-4);
+  }
+
+  .article-image {
+    width: 100%;
+    max-height: 500px;
+    object-fit: cover;
+    border-radius: var(--fp-radius-lg);
+    box-shadow: var(--fp-shadow-lg);
+  }
+
+  .article-body {
+    line-height: 1.7;
+    color: var(--fp-text-primary);
+  }
+
+  .article-body p {
+    margin-bottom: var(--fp-space-4);
+    font-size: var(--fp-text-lg);
+  }
+
+  .fighters-info {
+    background: var(--fp-bg-secondary);
+    padding: var(--fp-space-6);
+    border-radius: var(--fp-radius);
+    margin: var(--fp-space-8) 0;
+  }
+
+  .fighters-info h3 {
+    color: var(--fp-primary);
+    margin-bottom: var(--fp-space-3);
+  }
+
+  .fighters-info ul {
+    list-style: none;
+    padding: 0;
+  }
+
+  .fighters-info li {
+    background: var(--fp-white);
+    padding: var(--fp-space-2) var(--fp-space-4);
+    margin-bottom: var(--fp-space-2);
+    border-radius: var(--fp-radius);
+    font-weight: var(--fp-font-semibold);
+  }
+
+  .article-footer {
+    border-top: 1px solid var(--fp-border);
+    padding-top: var(--fp-space-6);
+    margin-top: var(--fp-space-8);
+  }
+
+  .article-tags {
+    display: flex;
+    flex-wrap: wrap;
+    gap: var(--fp-space-2);
+    margin-top: var(--fp-space-4);
+  }
+
+  .tag {
+    background: var(--fp-bg-secondary);
+    color: var(--fp-text-primary);
+    padding: 4px 8px;
+    border-radius: var(--fp-radius);
+    font-size: var(--fp-text-sm);
+    font-weight: var(--fp-font-medium);
+  }
+
+  .article-actions {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    flex-wrap: wrap;
+    gap: var(--fp-space-4);
+    margin-top: var(--fp-space-8);
+    padding-top: var(--fp-space-6);
+    border-top: 1px solid var(--fp-border);
+  }
+
+  @media (max-width: 768px) {
+    .article-title {
+      font-size: var(--fp-text-3xl);
+    }
+
+    .article-body p {
+      font-size: var(--fp-text-base);
+    }
+
+    .article-actions {
+      flex-direction: column;
+      align-items: stretch;
+    }
+  }
+</style>
+''')
+
 class MMAStoryGenerator:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Feeds are fetched in parallel, so let the pool keep a connection per thread
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Insertion-ordered so the oldest links are dropped first
+        self.seen_links = dict.fromkeys(load_json(SEEN_LINKS_FILE, default=[]))
         
         # MMA RSS feeds to monitor
         self.mma_feeds = [
@@ -62,34 +409,48 @@ class MMAStoryGenerator:
     
     def fetch_latest_stories(self, max_stories: int = 10) -> List[Dict]:
         """Fetch the latest MMA stories from RSS feeds."""
-        all_stories = []
-        
-        for feed_url in self.mma_feeds:
-            try:
-                logging.info(f"Fetching from: {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                for entry in feed.entries[:3]:  # Get top 3 from each feed
-                    story = {
-                        'original_title': entry.title,
-                        'original_link': entry.link,
-                        'published': entry.published if hasattr(entry, 'published') else str(datetime.now()),
-                        'source_domain': urlparse(feed_url).netloc,
-                        'description': getattr(entry, 'description', ''),
-                        'content': self._extract_content(entry)
-                    }
-                    all_stories.append(story)
-                    
-                time.sleep(2)  # Rate limiting
-                
-            except Exception as e:
-                logging.error(f"Error fetching from {feed_url}: {e}")
-                continue
+        # Every feed is on a different host, so fetch them all at once
+        # instead of one after another with a pause in between.
+        with ThreadPoolExecutor(max_workers=len(self.mma_feeds)) as executor:
+            results = executor.map(self._fetch_feed_stories, self.mma_feeds)
+        all_stories = [story for stories in results for story in stories]
         
         # Sort by publication date (newest first)
-        all_stories.sort(key=lambda x: x['published'], reverse=True)
+        all_stories.sort(key=itemgetter('published_ts'), reverse=True)
         return all_stories[:max_stories]
     
+    def _fetch_feed_stories(self, feed_url: str) -> List[Dict]:
+        """Fetch the top stories from a single RSS feed."""
+        stories = []
+        try:
+            logging.info(f"Fetching from: {feed_url}")
+            # Fetch through the shared session (keep-alive, pooling) and hand
+            # feedparser the raw bytes so it still sniffs the encoding itself.
+            # Only titles, links and text are used, so skip relative-URI
+            # rewriting; sanitizing stays on since descriptions end up in pages.
+            resp = self.session.get(feed_url, timeout=10)
+            resp.raise_for_status()
+            content = _truncate_after_entries(resp.content, ENTRIES_PER_FEED)
+            feed = feedparser.parse(content, resolve_relative_uris=False)
+            
+            for entry in feed.entries[:ENTRIES_PER_FEED]:
+                story = {
+                    'original_title': entry.title,
+                    'original_link': entry.link,
+                    'published': entry.published if hasattr(entry, 'published') else str(datetime.now()),
+                    'source_domain': urlparse(feed_url).netloc,
+                    'description': getattr(entry, 'description', ''),
+                    'content': self._extract_content(entry),
+                    # Epoch seconds for sorting; entries without a date count as new
+                    'published_ts': (calendar.timegm(entry.published_parsed)
+                                     if entry.get('published_parsed') else int(time.time()))
+                }
+                stories.append(story)
+                
+        except Exception as e:
+            logging.error(f"Error fetching from {feed_url}: {e}")
+        return stories
+    
     def _extract_content(self, entry) -> str:
         """Extract content from RSS entry."""
         content = ''
@@ -100,11 +461,15 @@ class MMAStoryGenerator:
         elif hasattr(entry, 'description'):
             content = entry.description
         
-        # Clean HTML tags
-        content = re.sub(r'<[^>]+>', '', content)
+        # Clean HTML tags (selectolax's C parser when installed, which also
+        # decodes entities and copes with broken markup)
+        if HTMLParser is not None:
+            content = HTMLParser(content).text(separator='')
+        else:
+            content = _RE_HTML_TAGS.sub('', content)
         return content[:500] + '...' if len(content) > 500 else content
     
-    def rewrite_story(self, original_story: Dict) -> Dict:
+    def rewrite_story(self, original_story: Dict, published_time: Optional[str] = None) -> Dict:
         """Rewrite an original story with new content and SEO optimization."""
         try:
             # Determine story type
@@ -132,7 +497,7 @@ class MMAStoryGenerator:
             tags = self._generate_tags(fighters, organization, story_type)
             
             # Find appropriate image
-            image_url = find_mma_image(new_title)
+            image_url = _cached_mma_image(new_title)
             if not image_url:
                 image_url = f"/images/news/2025/{slug[:20]}.jpg"  # Fallback
             
@@ -142,7 +507,7 @@ class MMAStoryGenerator:
                 'description': meta_description,
                 'content': full_content,
                 'image': image_url,
-                'publishedTime': datetime.now(timezone.utc).isoformat(),
+                'publishedTime': published_time or datetime.now(timezone.utc).isoformat(),
                 'category': organization or 'MMA',
                 'tags': tags,
                 'author': 'FightPulse Editorial Team',
@@ -163,41 +528,34 @@ class MMAStoryGenerator:
         """Determine the type of MMA story."""
         title_lower = title.lower()
         
-        fight_keywords = ['defeats', 'beats', 'submits', 'knockout', 'ko', 'tko', 'decision', 'wins', 'victory']
-        if any(keyword in title_lower for keyword in fight_keywords):
+        if _RE_FIGHT_KEYWORDS.search(title_lower):
             return 'fight_result'
         
-        announcement_keywords = ['announces', 'signs', 'contract', 'retires', 'returns', 'suspended', 'released']
-        if any(keyword in title_lower for keyword in announcement_keywords):
+        if _RE_ANNOUNCEMENT_KEYWORDS.search(title_lower):
             return 'announcement'
         
         return 'general'
     
     def _extract_fighters(self, title: str) -> List[str]:
         """Extract fighter names from title."""
-        # Common patterns for fighter names
-        patterns = [
-            r'(\w+\s+\w+)\s+(?:defeats|beats|submits|knocks out)\s+(\w+\s+\w+)',
-            r'(\w+\s+\w+)\s+(?:vs\.?|v\.?)\s+(\w+\s+\w+)',
-            r'(\w+\s+\w+)\s+(?:and|,)\s+(\w+\s+\w+)',
-        ]
-        
-        fighters = []
-        for pattern in patterns:
-            matches = re.findall(pattern, title, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    fighters.extend([name.strip() for name in match if len(name.strip()) > 3])
-        
-        return list(set(fighters))  # Remove duplicates
+        # Each pattern captures two names; a dict drops duplicates while keeping
+        # first-seen order, so fighters[:2] is stable from run to run.
+        # Patterns are scanned separately as their matches may overlap.
+        fighters = {}
+        for pattern in _RE_FIGHTER_PATTERNS:
+            for match in pattern.findall(title):
+                for name in match:
+                    if len(name) > 3:
+                        fighters[name] = None
+        
+        return list(fighters)
     
     def _extract_organization(self, title: str) -> Optional[str]:
         """Extract MMA organization from title."""
-        orgs = ['UFC', 'Bellator', 'PFL', 'ONE Championship', 'BKFC']
-        title_upper = title.upper()
+        found = {match.upper() for match in _RE_ORGS.findall(title)}
         
-        for org in orgs:
-            if org.upper() in title_upper:
+        for org in _ORGS:
+            if org.upper() in found:
                 return org
         return 'UFC'  # Default
     
@@ -206,15 +564,14 @@ class MMAStoryGenerator:
         event_info = {}
         
         # Extract event numbers (e.g., UFC 309)
-        ufc_match = re.search(r'UFC\s+(\d+)', title, re.IGNORECASE)
+        ufc_match = _RE_UFC_EVENT.search(title)
         if ufc_match:
             event_info['event_number'] = ufc_match.group(1)
             event_info['full_event'] = f"UFC {ufc_match.group(1)}"
         
         # Extract locations
-        location_patterns = [r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', r'at\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)']
-        for pattern in location_patterns:
-            location_match = re.search(pattern, title)
+        for pattern in _RE_LOCATIONS:
+            location_match = pattern.search(title)
             if location_match:
                 event_info['location'] = location_match.group(1)
                 break
@@ -239,8 +596,8 @@ class MMAStoryGenerator:
     def _generate_slug(self, title: str) -> str:
         """Generate URL slug from title."""
         # Convert to lowercase and replace spaces with hyphens
-        slug = re.sub(r'[^\w\s-]', '', title.lower())
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = _RE_SLUG_STRIP.sub('', title.lower())
+        slug = _RE_SLUG_DASH.sub('-', slug)
         return slug[:50]  # Limit length
     
     def _generate_full_content(self, original_story: Dict, template: Dict, fighters: List[str], organization: str) -> str:
@@ -312,10 +669,24 @@ class MMAStoryGenerator:
             # Save to the appropriate location
             story_path = f"/var/www/testing.fightpulse.net/src/pages/news/{story['slug']}.astro"
             
-            with open(story_path, 'w', encoding='utf-8') as f:
-                f.write(astro_content)
+            # Write a temp file next to the target and swap it in, so a crash
+            # never leaves a truncated page behind. mkstemp creates it 0600;
+            # the web server needs to read it.
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(story_path), suffix='.astro.tmp')
+            try:
+                os.fchmod(fd, 0o644)
+                with os.fdopen(fd, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.write(astro_content)
+                os.replace(tmp_path, story_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             
             logging.info(f"Saved story to: {story_path}")
+            self._mark_seen(story['source_link'])
             
             # Also update the news index to include this story
             self._update_news_index(story)
@@ -328,271 +699,17 @@ class MMAStoryGenerator:
     
     def _generate_astro_file_content(self, story: Dict) -> str:
         """Generate Astro file content for the story."""
-        return f'''---
-import Layout from '../../layouts/Layout.astro';
-import ShareBar from '../../components/ShareBar.astro';
-import ViewsCounter from '../../components/ViewsCounter.astro';
-
-const article = {{
-  title: "{story['title']}",
-  description: "{story['description']}",
-  image: "{story['image']}",
-  publishedTime: "{story['publishedTime']}",
-  category: "{story['category']}",
-  tags: {json.dumps(story['tags'])},
-  slug: "{story['slug']}",
-  author: "{story['author']}",
-  fighters: {json.dumps(story['fighters'])},
-  organization: "{story['organization']}"
-}};
-
-const currentUrl = `https://testing.fightpulse.net/news/${{article.slug}}`;
-const absoluteImageUrl = article.image.startsWith('http') 
-  ? article.image 
-  : `https://testing.fightpulse.net${{article.image}}`;
----
-
-<Layout 
-  title={{`${{article.title}} | FightPulse`}}
-  description={{article.description}}
-  image={{absoluteImageUrl}}
-  canonical={{currentUrl}}
-  article={{true}}
-  publishedTime={{article.publishedTime}}
-  tags={{article.tags}}
-  category={{article.category}}
->
-  <!-- Open Graph Meta Tags -->
-  <meta property="og:title" content={{article.title}} />
-  <meta property="og:description" content={{article.description}} />
-  <meta property="og:image" content={{absoluteImageUrl}} />
-  <meta property="og:url" content={{currentUrl}} />
-  <meta property="og:type" content="article" />
-  <meta property="og:site_name" content="FightPulse" />
-  <meta property="article:author" content={{article.author}} />
-  <meta property="article:published_time" content={{article.publishedTime}} />
-  <meta property="article:section" content={{article.category}} />
-  {{article.tags.map(tag => (
-    <meta property="article:tag" content={{tag}} />
-  ))}}
-  
-  <!-- Twitter Card Meta Tags -->
-  <meta name="twitter:card" content="summary_large_image" />
-  <meta name="twitter:title" content={{article.title}} />
-  <meta name="twitter:description" content={{article.description}} />
-  <meta name="twitter:image" content={{absoluteImageUrl}} />
-  
-  <!-- Additional SEO Meta Tags -->
-  <meta name="author" content={{article.author}} />
-  <meta name="robots" content="index, follow, max-snippet:-1, max-image-preview:large" />
-  <link rel="canonical" href={{currentUrl}} />
-
-  <div class="article-container">
-    <div class="container">
-      <article class="article-content">
-        <header class="article-header">
-          <div class="article-meta">
-            <span class="article-category">{{article.category}}</span>
-            <time class="article-date" datetime={{article.publishedTime}}>
-              {{new Date(article.publishedTime).toLocaleDateString('en-US', {{ 
-                year: 'numeric', 
-                month: 'long', 
-                day: 'numeric' 
-              }})}}
-            </time>
-          </div>
-          <h1 class="article-title">{{article.title}}</h1>
-          <p class="article-description">{{article.description}}</p>
-        </header>
-
-        <div class="article-hero">
-          <img src={{article.image}} alt={{article.title}} class="article-image" loading="eager">
-        </div>
-
-        <div class="article-body">
-          {story['content']}
-          
-          {{article.fighters.length > 0 && (
-            <div class="fighters-info">
-              <h3>Featured Fighters</h3>
-              <ul>
-                {{article.fighters.map(fighter => (
-                  <li>{{fighter}}</li>
-                ))}}
-              </ul>
-            </div>
-          )}}
-          
-          <div class="article-footer">
-            <p><strong>Organization:</strong> {{article.organization}}</p>
-            <p><strong>Category:</strong> {{article.category}}</p>
-            <div class="article-tags">
-              {{article.tags.map(tag => (
-                <span class="tag">{{tag}}</span>
-              ))}}
-            </div>
-          </div>
-        </div>
-
-        <div class="article-actions">
-          <ViewsCounter slug={{article.slug}} />
-          <ShareBar 
-            title={{article.title}}
-            description={{article.description}}
-          />
-        </div>
-      </article>
-    </div>
-  </div>
-</Layout>
-
-<style>
-  .article-container {{
-    padding: var(--fp-space-8) 0;
-    min-height: 100vh;
-  }}
-
-  .article-content {{
-    max-width: 800px;
-    margin: 0 auto;
-  }}
-
-  .article-header {{
-    text-align: center;
-    margin-bottom: var(--fp-space-8);
-  }}
-
-  .article-meta {{
-    display: flex;
-    justify-content: center;
-    gap: var(--fp-space-4);
-    margin-bottom: var(--fp-space-4);
-    font-size: var(--fp-text-sm);
-  }}
-
-  .article-category {{
-    background: var(--fp-primary);
-    color: white;
-    padding: 4px 12px;
-    border-radius: var(--fp-radius);
-    font-weight: var(--fp-font-semibold);
-  }}
-
-  .article-date {{
-    color: var(--fp-text-secondary);
-  }}
-
-  .article-title {{
-    font-size: var(--fp-text-4xl);
-    font-weight: var(--fp-font-bold);
-    color: var(--fp-text-primary);
-    margin-bottom: var(--fp-space-4);
-    line-height: 1.2;
-  }}
-
-  .article-description {{
-    font-size: var(--fp-text-lg);
-    color: var(--fp-text-secondary);
-    line-height: 1.6;
-  }}
-
-  .article-hero {{
-    margin: var(--fp-space-8) 0 var(--fp-space-12) 0;
-    padding: 0 var(--fp-space-4);
-  }}
-
-  .article-image {{
-    width: 100%;
-    max-height: 500px;
-    object-fit: cover;
-    border-radius: var(--fp-radius-lg);
-    box-shadow: var(--fp-shadow-lg);
-  }}
-
-  .article-body {{
-    line-height: 1.7;
-    color: var(--fp-text-primary);
-  }}
-
-  .article-body p {{
-    margin-bottom: var(--fp-space-4);
-    font-size: var(--fp-text-lg);
-  }}
-
-  .fighters-info {{
-    background: var(--fp-bg-secondary);
-    padding: var(--fp-space-6);
-    border-radius: var(--fp-radius);
-    margin: var(--fp-space-8) 0;
-  }}
-
-  .fighters-info h3 {{
-    color: var(--fp-primary);
-    margin-bottom: var(--fp-space-3);
-  }}
-
-  .fighters-info ul {{
-    list-style: none;
-    padding: 0;
-  }}
-
-  .fighters-info li {{
-    background: var(--fp-white);
-    padding: var(--fp-space-2) var(--fp-space-4);
-    margin-bottom: var(--fp-space-2);
-    border-radius: var(--fp-radius);
-    font-weight: var(--fp-font-semibold);
-  }}
-
-  .article-footer {{
-    border-top: 1px solid var(--fp-border);
-    padding-top: var(--fp-space-6);
-    margin-top: var(--fp-space-8);
-  }}
-
-  .article-tags {{
-    display: flex;
-    flex-wrap: wrap;
-    gap: var(--fp-space-2);
-    margin-top: var(--fp-space-4);
-  }}
-
-  .tag {{
-    background: var(--fp-bg-secondary);
-    color: var(--fp-text-primary);
-    padding: 4px 8px;
-    border-radius: var(--fp-radius);
-    font-size: var(--fp-text-sm);
-    font-weight: var(--fp-font-medium);
-  }}
-
-  .article-actions {{
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-    flex-wrap: wrap;
-    gap: var(--fp-space-4);
-    margin-top: var(--fp-space-8);
-    padding-top: var(--fp-space-6);
-    border-top: 1px solid var(--fp-border);
-  }}
-
-  @media (max-width: 768px) {{
-    .article-title {{
-      font-size: var(--fp-text-3xl);
-    }}
-
-    .article-body p {{
-      font-size: var(--fp-text-base);
-    }}
-
-    .article-actions {{
-      flex-direction: column;
-      align-items: stretch;
-    }}
-  }}
-</style>
-'''
+        # Frontmatter values are JS literals, so JSON-encode them; that also
+        # escapes any quotes in titles and fighter names.
+        values = {key: json.dumps(story[key], ensure_ascii=False) for key in _ASTRO_FIELDS}
+        return _ASTRO_TEMPLATE.substitute(values, content=story['content'])
+    
+    def _mark_seen(self, link: str) -> None:
+        """Remember that link has been published so later runs skip it."""
+        self.seen_links[link] = None
+        while len(self.seen_links) > MAX_SEEN_LINKS:
+            del self.seen_links[next(iter(self.seen_links))]
+        save_json(SEEN_LINKS_FILE, list(self.seen_links))
     
     def _update_news_index(self, story: Dict) -> None:
         """Update the news index page to include the new story."""
@@ -604,14 +721,22 @@ const absoluteImageUrl = article.image.startsWith('http')
         """Main method to generate new MMA stories."""
         logging.info(f"Starting generation of {count} new MMA stories...")
         
-        # Fetch latest stories
-        original_stories = self.fetch_latest_stories(count * 2)  # Get more than needed
-        
-        new_stories = []
-        for original_story in original_stories[:count]:
-            rewritten_story = self.rewrite_story(original_story)
-            if rewritten_story:
-                new_stories.append(rewritten_story)
+        # Fetch every candidate, then drop stories already published by an
+        # earlier run before doing any rewriting
+        original_stories = self.fetch_latest_stories(len(self.mma_feeds) * 3)
+        original_stories = [story for story in original_stories
+                            if story['original_link'] not in self.seen_links]
+        
+        # Rewriting is dominated by the image search's network calls, so
+        # rewrite the stories in parallel (results keep their order)
+        selected = original_stories[:count]
+        if not selected:
+            return []
+        # Stories from one batch share a publish timestamp
+        published_time = datetime.now(timezone.utc).isoformat()
+        with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+            rewritten = executor.map(partial(self.rewrite_story, published_time=published_time), selected)
+        new_stories = [story for story in rewritten if story]
         
         logging.info(f"Generated {len(new_stories)} new stories")
         return new_stories
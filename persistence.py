@@ -1,23 +1,66 @@
 import json
+import mmap
 import os
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this big are parsed straight from a read-only mapping
+# (orjson only) instead of being copied into a bytes object first.
+MMAP_THRESHOLD = 1 << 20
+
+def _dumps(data):
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; let the stdlib handle it
+    return json.dumps(data, indent=4).encode("utf-8")
 
 def load_json(filename, default=None):
     if os.path.exists(filename):
         try:
-            with open(filename, "r") as f:
-                return json.load(f)
+            with open(filename, "rb") as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        return orjson.loads(view)
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except Exception as e:
             print(f"Error reading {filename}: {e}")
             return default if default is not None else {}
     else:
         return default if default is not None else {}
 
-def save_json(filename, data):
+def save_json(filename, data, fsync=False):
+    # Write a uniquely named temp file and rename it over filename: readers and
+    # a crash mid-write see old or new contents only, and concurrent savers
+    # from different threads can't interleave. fsync=True also syncs first.
+    tmp = None
     try:
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
+        payload = _dumps(data)
+        try:
+            mode = os.stat(filename).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, filename)
     except Exception as e:
         print(f"Error saving {filename}: {e}")
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
 def append_line(filename, line):
     try:
@@ -25,4 +68,3 @@ def append_line(filename, line):
             f.write(f"{line}\n")
     except Exception as e:
         print(f"Error appending to {filename}: {e}")
-
@@ -4,6 +4,7 @@ Proxy utility module for FuzzyFeeds
 Supports SOCKS4, SOCKS5, HTTP, and HTTPS proxies
 """
 
+import http.client
 import json
 import os
 import socket
@@ -11,8 +12,14 @@ import socks
 import urllib.request
 import urllib.parse
 import ssl
+import time
 import logging
-from urllib.parse import urlparse
+from functools import lru_cache
+try:
+    import requests
+except ImportError:
+    requests = None
+from urllib.parse import urlparse, urlsplit
 from config import (
     enable_proxy, proxy_type, proxy_host, proxy_port,
     proxy_username, proxy_password,
@@ -31,6 +38,108 @@ try:
 except ImportError:
     proxy_whitelist = []
 
+# Skip certificate checks on proxied TLS sockets. Older configs predate the
+# setting and relied on unverified connections, so that stays the fallback.
+try:
+    from config import insecure_proxy_tls
+except ImportError:
+    insecure_proxy_tls = True
+
+# URL probed by test_proxy_connection at startup
+try:
+    from config import proxy_test_url
+except ImportError:
+    proxy_test_url = "http://httpbin.org/ip"
+
+# proxy_type is fixed at import, so normalise it and resolve the PySocks
+# constant and auth arguments once instead of re-dispatching per socket.
+_PROXY_KIND = str(proxy_type).lower()
+_SOCKS_TYPES = {
+    "socks5": socks.SOCKS5,
+    "socks4": socks.SOCKS4,
+    "http": socks.HTTP,
+    "https": socks.HTTP,
+}
+# SOCKS4 has no password auth; SOCKS5 only authenticates with both parts set.
+if _PROXY_KIND == "socks4" or (_PROXY_KIND == "socks5" and not (proxy_username and proxy_password)):
+    _PROXY_AUTH = {}
+else:
+    _PROXY_AUTH = {"username": proxy_username, "password": proxy_password}
+_PROXY_KIND_UPPER = _PROXY_KIND.upper()
+
+# Proxy URL and the proxies mapping for requests/urllib, built once.
+if proxy_username and proxy_password:
+    _PROXY_AUTH_STRING = f"{proxy_username}:{proxy_password}@"
+else:
+    _PROXY_AUTH_STRING = ""
+PROXY_URL = f"{_PROXY_KIND}://{_PROXY_AUTH_STRING}{proxy_host}:{proxy_port}"
+PROXIES = {'http': PROXY_URL, 'https': PROXY_URL}
+
+# Which connection types go through the proxy, fixed at import. Types not
+# listed take the default: proxied, unless only feed fetches are proxied.
+if feeds_only_proxy:
+    _PROXY_ROUTES = {"http": True}
+    _PROXY_ROUTE_DEFAULT = False
+else:
+    _PROXY_ROUTES = {
+        "irc": bool(proxy_irc),
+        "http": bool(proxy_http),
+        "matrix": bool(proxy_matrix),
+        "discord": bool(proxy_discord),
+    }
+    _PROXY_ROUTE_DEFAULT = True
+
+# One TLS context for every wrapped proxy socket: the CA store is loaded
+# once, and connections sharing it can resume TLS sessions. The default
+# context verifies against the system CAs and negotiates TLS 1.2/1.3.
+_SSL_CTX = ssl.create_default_context()
+if insecure_proxy_tls:
+    _SSL_CTX.check_hostname = False
+    _SSL_CTX.verify_mode = ssl.CERT_NONE
+
+
+def _new_proxy_socket():
+    """Return a PySocks socket pointed at the configured proxy."""
+    sock = socks.socksocket()
+    sock.set_proxy(_SOCKS_TYPES[_PROXY_KIND], proxy_host, proxy_port, **_PROXY_AUTH)
+    return sock
+
+
+def _socks_create_connection(address, timeout=None, source_address=None):
+    sock = _new_proxy_socket()
+    if timeout is not None and timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+        sock.settimeout(timeout)
+    sock.connect(address)
+    return sock
+
+
+# http.client connections that reach the target through the SOCKS proxy.
+# HTTPSConnection.connect() calls the HTTP one and then wraps the socket in
+# TLS, so swapping the _create_connection hook covers both schemes.
+class _SocksConnectionMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _socks_create_connection
+
+
+class _SocksHTTPConnection(_SocksConnectionMixin, http.client.HTTPConnection):
+    pass
+
+
+class _SocksHTTPSConnection(_SocksConnectionMixin, http.client.HTTPSConnection):
+    pass
+
+
+class _SocksHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(_SocksHTTPConnection, req)
+
+
+class _SocksHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(_SocksHTTPSConnection, req, context=self._context)
+
+
 # Runtime whitelist — domains added automatically when a feed is registered,
 # so newly-added feeds bypass the SOCKS proxy by default (a lot of feed hosts
 # block Tor exit nodes). The static config whitelist still applies.
@@ -64,6 +173,38 @@ def _load_runtime_whitelist():
     return []
 
 
+# Static + runtime whitelist as a trie of reversed domain labels
+# ("a.example.com" -> com -> example -> a), so a lookup walks the URL's host
+# label by label instead of testing every entry. Rebuilt when the runtime
+# file changes (it can also be edited by the dashboard process).
+_WHITELIST_END = '$'
+_whitelist_trie = None
+_whitelist_mtime = None
+
+
+def _build_whitelist_trie(domains):
+    trie = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(str(domain).lower().split('.')):
+            node = node.setdefault(label, {})
+        node[_WHITELIST_END] = True
+    return trie
+
+
+def _get_whitelist_trie():
+    global _whitelist_trie, _whitelist_mtime
+    try:
+        mtime = os.stat(RUNTIME_WHITELIST_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _whitelist_trie is None or mtime != _whitelist_mtime:
+        _whitelist_trie = _build_whitelist_trie(list(proxy_whitelist) + _load_runtime_whitelist())
+        _whitelist_mtime = mtime
+        _whitelist_match.cache_clear()
+    return _whitelist_trie
+
+
 def add_to_runtime_whitelist(url):
     """Add a feed URL's domain to the runtime whitelist so it bypasses the proxy.
 
@@ -71,6 +212,7 @@ def add_to_runtime_whitelist(url):
     the static config whitelist or the runtime file. Safe to call from any
     feed-adding code path; failure is logged but never raised.
     """
+    global _whitelist_trie
     domain = _extract_domain(url)
     if not domain:
         return False
@@ -87,12 +229,34 @@ def add_to_runtime_whitelist(url):
         with open(tmp_path, 'w') as f:
             json.dump(sorted(current), f, indent=2)
         os.replace(tmp_path, RUNTIME_WHITELIST_FILE)
+        _whitelist_trie = None
         logging.info(f"Added '{domain}' to runtime proxy whitelist (from {url})")
         return True
     except Exception as e:
         logging.error(f"Error updating runtime proxy whitelist for {url}: {e}")
         return False
 
+@lru_cache(maxsize=2048)
+def _whitelist_match(url):
+    """Return the whitelist entry covering url's host, or None.
+
+    Feed URLs repeat every poll, so results are cached per URL; the cache is
+    cleared whenever _get_whitelist_trie rebuilds the trie.
+    """
+    # hostname is already lowercased, without port or credentials.
+    domain = urlsplit(url).hostname or ''
+
+    # Check if domain or any parent domain is in whitelist
+    node = _whitelist_trie
+    labels = domain.split('.')
+    for depth, label in enumerate(reversed(labels), 1):
+        node = node.get(label)
+        if node is None:
+            return None
+        if _WHITELIST_END in node:
+            return '.'.join(labels[-depth:])
+    return None
+
 def is_url_whitelisted(url):
     """
     Check if a URL's domain is in the proxy whitelist
@@ -103,24 +267,17 @@ def is_url_whitelisted(url):
     Returns:
         bool: True if the domain should bypass proxy, False otherwise
     """
-    try:
-        domain = urlparse(url).netloc.lower()
-        # Remove port if present
-        if ':' in domain:
-            domain = domain.split(':')[0]
+    # The runtime file can add entries later, so an empty whitelist is
+    # checked per call rather than compiled away at import.
+    if not url or not _get_whitelist_trie():
+        return False
 
-        combined = list(proxy_whitelist) + _load_runtime_whitelist()
-        if not combined:
+    try:
+        whitelisted_domain = _whitelist_match(url)
+        if whitelisted_domain is None:
             return False
-
-        # Check if domain or any parent domain is in whitelist
-        for whitelisted_domain in combined:
-            whitelisted_domain = str(whitelisted_domain).lower()
-            if domain == whitelisted_domain or domain.endswith('.' + whitelisted_domain):
-                logging.info(f"URL {url} bypassing proxy (whitelisted domain: {whitelisted_domain})")
-                return True
-
-        return False
+        logging.info("URL %s bypassing proxy (whitelisted domain: %s)", url, whitelisted_domain)
+        return True
     except Exception as e:
         logging.error(f"Error checking whitelist for {url}: {e}")
         return False
@@ -138,47 +295,16 @@ def create_proxy_socket(connection_type="general"):
     if not enable_proxy:
         return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     
-    # Check if this connection type should use proxy
-    use_proxy = True
-    
-    # If feeds_only_proxy is enabled, only allow HTTP connections through proxy
-    if feeds_only_proxy:
-        if connection_type != "http":
-            use_proxy = False
-    else:
-        # Normal proxy routing based on individual settings
-        if connection_type == "irc" and not proxy_irc:
-            use_proxy = False
-        elif connection_type == "http" and not proxy_http:
-            use_proxy = False
-        elif connection_type == "matrix" and not proxy_matrix:
-            use_proxy = False
-        elif connection_type == "discord" and not proxy_discord:
-            use_proxy = False
-    
-    if not use_proxy:
+    if not _PROXY_ROUTES.get(connection_type, _PROXY_ROUTE_DEFAULT):
         return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     
     # Create proxy socket
-    if proxy_type.lower() == "socks5":
-        proxy_socket = socks.socksocket()
-        if proxy_username and proxy_password:
-            proxy_socket.set_proxy(socks.SOCKS5, proxy_host, proxy_port, 
-                                 username=proxy_username, password=proxy_password)
-        else:
-            proxy_socket.set_proxy(socks.SOCKS5, proxy_host, proxy_port)
-    elif proxy_type.lower() == "socks4":
-        proxy_socket = socks.socksocket()
-        proxy_socket.set_proxy(socks.SOCKS4, proxy_host, proxy_port)
-    elif proxy_type.lower() in ["http", "https"]:
-        proxy_socket = socks.socksocket()
-        proxy_socket.set_proxy(socks.HTTP, proxy_host, proxy_port, 
-                             username=proxy_username, password=proxy_password)
-    else:
+    if _PROXY_KIND not in _SOCKS_TYPES:
         logging.error(f"Unsupported proxy type: {proxy_type}")
         return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    proxy_socket = _new_proxy_socket()
     
-    logging.info(f"Created {proxy_type.upper()} proxy socket for {connection_type} connections")
+    logging.info("Created %s proxy socket for %s connections", _PROXY_KIND_UPPER, connection_type)
     return proxy_socket
 
 def create_proxy_ssl_context(connection_type="general"):
@@ -191,10 +317,7 @@ def create_proxy_ssl_context(connection_type="general"):
     Returns:
         SSL context configured for proxy use
     """
-    context = ssl.create_default_context()
-    context.check_hostname = False
-    context.verify_mode = ssl.CERT_NONE
-    return context
+    return _SSL_CTX
 
 def wrap_socket_with_proxy(raw_socket, server_hostname, connection_type="general"):
     """
@@ -208,8 +331,7 @@ def wrap_socket_with_proxy(raw_socket, server_hostname, connection_type="general
     Returns:
         SSL-wrapped socket
     """
-    context = create_proxy_ssl_context(connection_type)
-    return context.wrap_socket(raw_socket, server_hostname=server_hostname)
+    return _SSL_CTX.wrap_socket(raw_socket, server_hostname=server_hostname)
 
 def create_proxy_opener(url=None):
     """
@@ -223,9 +345,18 @@ def create_proxy_opener(url=None):
     """
     # Check if URL is whitelisted (should bypass proxy)
     if url and is_url_whitelisted(url):
-        logging.info(f"Creating direct opener for whitelisted URL: {url}")
-        return urllib.request.build_opener()
-    
+        logging.info("Using direct opener for whitelisted URL: %s", url)
+        return _direct_opener()
+    return _build_proxy_opener()
+
+@lru_cache(maxsize=None)
+def _direct_opener():
+    return urllib.request.build_opener()
+
+@lru_cache(maxsize=None)
+def _build_proxy_opener():
+    """Build the opener for proxied HTTP; the proxy config is fixed at import,
+    so this runs once and the handlers are shared by every caller."""
     # For HTTP requests, check if we should use proxy
     if not enable_proxy:
         return urllib.request.build_opener()
@@ -235,137 +366,85 @@ def create_proxy_opener(url=None):
     if not feeds_only_proxy and not proxy_http:
         return urllib.request.build_opener()
     
-    # Build proxy URL
-    if proxy_username and proxy_password:
-        auth_string = f"{proxy_username}:{proxy_password}@"
-    else:
-        auth_string = ""
-    
-    if proxy_type.lower() == "socks5":
-        proxy_url = f"socks5://{auth_string}{proxy_host}:{proxy_port}"
-    elif proxy_type.lower() == "socks4":
-        proxy_url = f"socks4://{auth_string}{proxy_host}:{proxy_port}"
-    elif proxy_type.lower() == "http":
-        proxy_url = f"http://{auth_string}{proxy_host}:{proxy_port}"
-    elif proxy_type.lower() == "https":
-        proxy_url = f"https://{auth_string}{proxy_host}:{proxy_port}"
-    else:
+    if _PROXY_KIND not in _SOCKS_TYPES:
         logging.error(f"Unsupported proxy type for HTTP: {proxy_type}")
         return urllib.request.build_opener()
     
-    # For SOCKS proxies, we need to use PySocks with a custom handler
-    if proxy_type.lower().startswith("socks"):
-        try:
-            import socks
-            
-            # Create a custom SOCKS handler instead of global socket override
-            class SocksHTTPSHandler(urllib.request.HTTPSHandler):
-                def __init__(self):
-                    super().__init__()
-                
-                def https_open(self, req):
-                    return self.do_open(self._get_socks_connection, req)
-                
-                def _get_socks_connection(self, host, port=None, timeout=None):
-                    if proxy_type.lower() == "socks5":
-                        sock = socks.socksocket()
-                        if proxy_username and proxy_password:
-                            sock.set_proxy(socks.SOCKS5, proxy_host, proxy_port, 
-                                         username=proxy_username, password=proxy_password)
-                        else:
-                            sock.set_proxy(socks.SOCKS5, proxy_host, proxy_port)
-                    else:
-                        sock = socks.socksocket()
-                        sock.set_proxy(socks.SOCKS4, proxy_host, proxy_port)
-                    
-                    if port is None:
-                        port = 443
-                    sock.connect((host, port))
-                    return sock
-            
-            class SocksHTTPHandler(urllib.request.HTTPHandler):
-                def __init__(self):
-                    super().__init__()
-                
-                def http_open(self, req):
-                    return self.do_open(self._get_socks_connection, req)
-                
-                def _get_socks_connection(self, host, port=None, timeout=None):
-                    if proxy_type.lower() == "socks5":
-                        sock = socks.socksocket()
-                        if proxy_username and proxy_password:
-                            sock.set_proxy(socks.SOCKS5, proxy_host, proxy_port, 
-                                         username=proxy_username, password=proxy_password)
-                        else:
-                            sock.set_proxy(socks.SOCKS5, proxy_host, proxy_port)
-                    else:
-                        sock = socks.socksocket()
-                        sock.set_proxy(socks.SOCKS4, proxy_host, proxy_port)
-                    
-                    if port is None:
-                        port = 80
-                    sock.connect((host, port))
-                    return sock
-            
-            opener = urllib.request.build_opener(SocksHTTPHandler(), SocksHTTPSHandler())
-            logging.info(f"Created {proxy_type.upper()} proxy opener for HTTP requests")
-            return opener
-            
-        except ImportError:
-            logging.error("PySocks module required for SOCKS proxy support")
-            return urllib.request.build_opener()
+    # For SOCKS proxies, route through PySocks per connection instead of
+    # overriding the global socket
+    if _PROXY_KIND.startswith("socks"):
+        opener = urllib.request.build_opener(_SocksHTTPHandler(), _SocksHTTPSHandler())
+        logging.info("Created %s proxy opener for HTTP requests", _PROXY_KIND_UPPER)
+        return opener
     
     # For HTTP proxies
-    proxy_handler = urllib.request.ProxyHandler({
-        'http': proxy_url,
-        'https': proxy_url
-    })
+    proxy_handler = urllib.request.ProxyHandler(PROXIES)
     
     opener = urllib.request.build_opener(proxy_handler)
-    logging.info(f"Created HTTP proxy opener with {proxy_type.upper()} proxy")
+    logging.info("Created HTTP proxy opener with %s proxy", _PROXY_KIND_UPPER)
     return opener
 
-def test_proxy_connection():
+# Probe session for test_proxy_connection, created on first use and kept so
+# repeated tests reuse the same (proxied) connection. Only SOCKS proxies are
+# probed through the proxy; other types test the direct connection.
+_probe_session = None
+_probe_proxies = PROXIES if _PROXY_KIND.startswith("socks") else None
+
+
+def _get_shared_session():
+    global _probe_session
+    if _probe_session is None:
+        _probe_session = requests.Session()
+    return _probe_session
+
+
+# Probe results are reused for PROXY_TEST_TTL seconds, so reconnect loops
+# calling test_proxy_connection don't hit the network every time.
+PROXY_TEST_TTL = 60
+_probe_results = {}
+
+
+def test_proxy_connection(probe_url=None):
     """
     Test proxy connectivity
     
+    Args:
+        probe_url: URL to send a HEAD request to (default: proxy_test_url)
+    
     Returns:
         bool: True if proxy is working, False otherwise
     """
     if not enable_proxy:
         logging.info("Proxy disabled, direct connection test passed")
         return True
-    
+
+    url = probe_url or proxy_test_url
+    now = time.monotonic()
+    cached = _probe_results.get(url)
+    if cached is not None and now - cached[0] < PROXY_TEST_TTL:
+        return cached[1]
+    result = _probe(url)
+    _probe_results[url] = (now, result)
+    return result
+
+
+def _probe(url):
+    if requests is None:
+        logging.error("Proxy test failed: requests module not available")
+        return False
+
     try:
-        # Test with a simple HTTP request using requests directly
-        import requests
-        
-        if proxy_type.lower().startswith("socks"):
-            if proxy_username and proxy_password:
-                auth_string = f"{proxy_username}:{proxy_password}@"
-            else:
-                auth_string = ""
-            
-            if proxy_type.lower() == "socks5":
-                proxy_url = f"socks5://{auth_string}{proxy_host}:{proxy_port}"
-            else:
-                proxy_url = f"socks4://{auth_string}{proxy_host}:{proxy_port}"
-            
-            proxies = {
-                'http': proxy_url,
-                'https': proxy_url
-            }
-            
-            response = requests.get("http://httpbin.org/ip", proxies=proxies, timeout=10)
-            data = response.text
-            logging.info(f"Proxy test successful: {data.strip()}")
-            return True
+        session = _get_shared_session()
+        response = session.head(url, proxies=_probe_proxies,
+                                timeout=5, allow_redirects=False)
+        if response.status_code >= 500:
+            logging.error(f"Proxy test failed: HTTP {response.status_code}")
+            return False
+        if _probe_proxies:
+            logging.info(f"Proxy test successful: HTTP {response.status_code}")
         else:
-            # For HTTP proxies, use regular requests
-            response = requests.get("http://httpbin.org/ip", timeout=10)
-            data = response.text
-            logging.info(f"Direct connection test successful: {data.strip()}")
-            return True
+            logging.info(f"Direct connection test successful: HTTP {response.status_code}")
+        return True
             
     except Exception as e:
         logging.error(f"Proxy test failed: {e}")
@@ -377,7 +456,7 @@ def log_proxy_status():
         logging.info("Proxy: DISABLED - All connections direct")
         return
     
-    logging.info(f"Proxy: ENABLED - {proxy_type.upper()} proxy at {proxy_host}:{proxy_port}")
+    logging.info(f"Proxy: ENABLED - {_PROXY_KIND_UPPER} proxy at {proxy_host}:{proxy_port}")
     
     if feeds_only_proxy:
         logging.info("Proxy mode: FEEDS ONLY - Only RSS/HTTP requests use proxy")
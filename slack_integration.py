@@ -1,17 +1,84 @@
 #!/usr/bin/env python3
+import atexit
 import logging
+import queue
+import ssl
+import threading
+import time
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from config import slack_token, slack_channel
 
 logging.basicConfig(level=logging.INFO)
 
-client = WebClient(token=slack_token)
+# WebClient goes through urllib, which otherwise builds a fresh SSL context
+# (and re-reads the CA store) for every post; give it one to share.
+client = WebClient(token=slack_token, ssl=ssl.create_default_context(), timeout=10)
 
-def post_message(text):
+# post_message only queues; a background thread waits up to BATCH_DELAY for
+# more messages and sends them as one chat_postMessage, so a burst of feed
+# items costs one Slack round-trip and never blocks the caller.
+BATCH_DELAY = 1.0
+MAX_BATCH_MESSAGES = 10
+MAX_BATCH_CHARS = 3500
+# At exit, wait this long (seconds) for queued messages to go out.
+FLUSH_TIMEOUT = 10.0
+
+_outbox = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+def _send(text):
     try:
         response = client.chat_postMessage(channel=slack_channel, text=text)
         logging.info("Message posted to Slack: %s", response['ts'])
     except SlackApiError as e:
         logging.error("Error posting to Slack: %s", e.response['error'])
+    except Exception as e:
+        logging.error("Error posting to Slack: %s", e)
+
+def _drain():
+    # A None in the queue, put there by flush(), ends the worker once
+    # everything queued before it has been sent.
+    while True:
+        text = _outbox.get()
+        if text is None:
+            return
+        batch = [text]
+        size = len(text)
+        deadline = time.monotonic() + BATCH_DELAY
+        while len(batch) < MAX_BATCH_MESSAGES:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                text = _outbox.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if text is None:
+                _send("\n".join(batch))
+                return
+            if size + 1 + len(text) > MAX_BATCH_CHARS:
+                _send("\n".join(batch))
+                batch, size = [], -1
+            batch.append(text)
+            size += 1 + len(text)
+        _send("\n".join(batch))
+
+def post_message(text):
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(target=_drain, name="slack-poster", daemon=True)
+                _worker.start()
+    _outbox.put(text)
+
+def flush():
+    """Send everything still queued and stop the worker."""
+    if _worker is not None and _worker.is_alive():
+        _outbox.put(None)
+        _worker.join(FLUSH_TIMEOUT)
 
+# The worker is a daemon thread, so queued posts would be dropped at exit.
+atexit.register(flush)
@@ -1,22 +1,22 @@
 #!/usr/bin/env python3
 import asyncio
 import logging
-import json
-import os
-import time
 import fnmatch
-from telegram import Update, Bot
+import re
+import signal
+from functools import lru_cache
+from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 from telegram.error import TelegramError
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from config import (
-    telegram_bot_token, telegram_channels, admin, admins,
-    start_time
-)
+import config
+from config import telegram_bot_token, telegram_channels
 import feed
-import persistence
 import users
-from commands import get_help
 from channels import load_channels
 
 
@@ -25,7 +25,18 @@ logging.basicConfig(level=logging.INFO)
 # Global variables
 telegram_bot_instance = None
 telegram_application = None
-POSTED_FILE = "telegram_posted.json"
+# Loop the bot runs on, set by run_telegram_bot(); other threads send through it.
+telegram_loop = None
+# Feed announcements carry their URL on a line of its own starting "Link:".
+_LINK_LINE_RE = re.compile(r"^Link:(.*)$", re.MULTILINE)
+# Messages to one chat within COALESCE_DELAY seconds go out as a single API
+# call, split again at Telegram's message length limit.
+COALESCE_DELAY = 0.25
+TELEGRAM_MAX_MESSAGE = 4096
+_pending_messages = {}
+# Sends started on the bot's own loop; the loop only keeps weak references
+# to tasks, so hold them here until they finish.
+_send_tasks = set()
 
 # Disable internal feed loop - centralized polling handles feeds
 feed_loop_enabled = False
@@ -34,40 +45,27 @@ def disable_feed_loop():
     global feed_loop_enabled
     feed_loop_enabled = False
 
-# --- Per-Chat Posted Feeds Storage ---
-def load_posted_articles():
-    if os.path.exists(POSTED_FILE):
-        try:
-            with open(POSTED_FILE, "r") as f:
-                data = json.load(f)
-                return {chat: set(links) for chat, links in data.items()}
-        except Exception as e:
-            logging.error(f"Error loading {POSTED_FILE}: {e}")
-            return {}
-    return {}
+# Lower-cased super admin and global admins; rebuilt by refresh_admins() after !reload.
+_ADMIN_LOWER = ""
+_ADMINS_LOWER = frozenset()
 
-def save_posted_articles(posted_dict):
-    try:
-        # Keep only the most recent 500 links per chat to prevent unbounded growth
-        MAX_LINKS_PER_CHAT = 500
-        serializable = {}
-        for chat, links in posted_dict.items():
-            link_list = list(links)
-            if len(link_list) > MAX_LINKS_PER_CHAT:
-                link_list = link_list[-MAX_LINKS_PER_CHAT:]
-            serializable[chat] = link_list
-        with open(POSTED_FILE, "w") as f:
-            json.dump(serializable, f, indent=4)
-    except Exception as e:
-        logging.error(f"Error saving {POSTED_FILE}: {e}")
+def refresh_admins():
+    global _ADMIN_LOWER, _ADMINS_LOWER
+    _ADMIN_LOWER = config.admin.lower()
+    _ADMINS_LOWER = frozenset(a.lower() for a in config.admins)
+
+refresh_admins()
 
-# Global posted articles tracking
-posted_articles = load_posted_articles()
+@lru_cache(maxsize=256)
+def _glob_match(pattern):
+    """Compiled matcher for a glob pattern, built once per distinct pattern."""
+    return re.compile(fnmatch.translate(pattern)).match
 
 def match_feed(feed_dict, pattern):
     """Match feed names with wildcards support"""
     if "*" in pattern or "?" in pattern:
-        matches = [name for name in feed_dict.keys() if fnmatch.fnmatch(name, pattern)]
+        match = _glob_match(pattern)
+        matches = [name for name in feed_dict if match(name)]
         return matches[0] if len(matches) == 1 else (matches if matches else None)
     return pattern if pattern in feed_dict else None
 
@@ -93,8 +91,8 @@ def is_authorized_user(username, chat_id):
     user_key = get_user_key(username)
     
     # Check if user is super admin or global admin
-    is_super_admin = (user_key == admin.lower())
-    is_global_admin = user_key in [a.lower() for a in admins]
+    is_super_admin = (user_key == _ADMIN_LOWER)
+    is_global_admin = user_key in _ADMINS_LOWER
     
     # For now, allow authorized users to manage feeds in any chat they have access to
     # This can be enhanced later with per-chat admin mapping
@@ -103,7 +101,7 @@ def is_authorized_user(username, chat_id):
 
 async def send_telegram_message_async(chat_id, message, bypass_posted_check=False):
     """Send message to Telegram chat with duplicate checking"""
-    global posted_articles, telegram_bot_instance
+    global telegram_bot_instance
     
     if not telegram_bot_instance:
         logging.error("Telegram bot instance not initialized.")
@@ -111,10 +109,10 @@ async def send_telegram_message_async(chat_id, message, bypass_posted_check=Fals
     
     # Check for duplicate posts (extract link from message)
     link = None
-    for line in message.splitlines():
-        if line.startswith("Link:"):
-            link = line[len("Link:"):].strip()
-            break
+    if "Link:" in message:
+        m = _LINK_LINE_RE.search(message)
+        if m:
+            link = m.group(1).strip()
 
     if link and not bypass_posted_check:
         # Use database for dedup instead of JSON files
@@ -122,71 +120,98 @@ async def send_telegram_message_async(chat_id, message, bypass_posted_check=Fals
             from database import get_db
             db = get_db()
             if db.is_link_posted_to_channel(link, str(chat_id)):
-                logging.info(f"Link already posted in Telegram chat {chat_id}: {link}")
+                logging.info("Link already posted in Telegram chat %s: %s", chat_id, link)
                 return
         except Exception as e:
-            logging.debug(f"DB dedup check failed, proceeding: {e}")
-    
+            logging.debug("DB dedup check failed, proceeding: %s", e)
+
+    # The first message for a chat waits COALESCE_DELAY and then sends
+    # everything queued for that chat meanwhile, packed into as few messages
+    # as fit; later callers just append to the open batch.
+    chat_key = str(chat_id)
+    batch = _pending_messages.get(chat_key)
+    if batch is not None:
+        batch.append(message)
+        return
+    _pending_messages[chat_key] = batch = [message]
+    try:
+        await asyncio.sleep(COALESCE_DELAY)
+    finally:
+        del _pending_messages[chat_key]
+    for text in _pack_messages(batch):
+        await _send_now(chat_id, text)
+
+def _pack_messages(messages):
+    """Join messages with blank lines into chunks of at most TELEGRAM_MAX_MESSAGE characters."""
+    chunks = []
+    current = ""
+    for message in messages:
+        if current and len(current) + 2 + len(message) > TELEGRAM_MAX_MESSAGE:
+            chunks.append(current)
+            current = message
+        else:
+            current = current + "\n\n" + message if current else message
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def _send_now(chat_id, message):
     try:
         await telegram_bot_instance.send_message(chat_id=chat_id, text=message, parse_mode=None)
-        logging.info(f"Sent Telegram message to {chat_id}: {message[:100]}...")
+        logging.info("Sent Telegram message to %s: %s...", chat_id, message[:100])
     except TelegramError as e:
-        logging.error(f"Failed to send Telegram message to {chat_id}: {e}")
+        logging.error("Failed to send Telegram message to %s: %s", chat_id, e)
     except Exception as e:
-        logging.error(f"Unexpected error sending Telegram message to {chat_id}: {e}")
+        logging.error("Unexpected error sending Telegram message to %s: %s", chat_id, e)
+
+def _log_send_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logging.error("Error sending Telegram message: %s", future.exception())
 
 def send_telegram_message(chat_id, message, bypass_posted_check=False):
     """Thread-safe wrapper for sending Telegram messages"""
-    global telegram_application
-    
     if not telegram_application:
         logging.error("Telegram application not initialized.")
         return
-        
-    # Create and run the async task in a thread-safe way
+    if telegram_loop is None or not telegram_loop.is_running():
+        logging.error("Telegram event loop not available.")
+        return
+
+    coro = send_telegram_message_async(chat_id, message, bypass_posted_check)
     try:
-        # Try to get the current event loop
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're in an async context, schedule the task
-            asyncio.create_task(send_telegram_message_async(chat_id, message, bypass_posted_check))
-        except RuntimeError:
-            # No running loop, we're likely in a different thread
-            # Create a new event loop for this thread if needed
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                # No event loop in this thread, create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Run the coroutine in the loop
-            if not loop.is_running():
-                loop.run_until_complete(send_telegram_message_async(chat_id, message, bypass_posted_check))
-            else:
-                # Use run_coroutine_threadsafe for thread safety
-                import concurrent.futures
-                future = asyncio.run_coroutine_threadsafe(
-                    send_telegram_message_async(chat_id, message, bypass_posted_check), 
-                    loop
-                )
-                future.result(timeout=30)  # Wait up to 30 seconds
-                
-    except Exception as e:
-        logging.error(f"Error scheduling Telegram message: {e}")
-        # As a fallback, try using threading to run in the bot's event loop
-        import threading
-        
-        def run_async():
-            try:
-                asyncio.run(send_telegram_message_async(chat_id, message, bypass_posted_check))
-            except Exception as thread_error:
-                logging.error(f"Fallback Telegram message failed: {thread_error}")
-        
-        thread = threading.Thread(target=run_async, daemon=True)
-        thread.start()
+        on_bot_loop = asyncio.get_running_loop() is telegram_loop
+    except RuntimeError:
+        on_bot_loop = False
+    if on_bot_loop:
+        task = asyncio.create_task(coro)
+        _send_tasks.add(task)
+        task.add_done_callback(_send_tasks.discard)
+        task.add_done_callback(_log_send_failure)
+    else:
+        # Don't wait for the send, just log if it fails
+        asyncio.run_coroutine_threadsafe(coro, telegram_loop).add_done_callback(_log_send_failure)
 
 # Telegram Bot Command Handlers
+_HELP_TEXT = (
+    "📡 **RSS Bot Commands**\n\n"
+    "**Feed Management:**\n"
+    "• `/listfeeds` - List all feeds for this chat\n"
+    "• `/latest <feed_name>` - Show latest entry from a feed\n"
+    "• `/search <query>` - Search for RSS feeds\n"
+    "• `/getfeed <query>` - Find and show latest from a feed\n"
+    "• `/stats` - Show bot statistics\n\n"
+    "**Admin Commands:**\n"
+    "• `/addfeed <name> <url>` - Add RSS feed to this chat\n"
+    "• `/delfeed <name>` - Remove RSS feed from this chat\n"
+    "• `/getadd <query>` - Search and auto-add feed\n\n"
+    "**Personal Subscriptions:**\n"
+    "• `/addsub <name> <url>` - Subscribe to private feed\n"
+    "• `/unsub <name>` - Unsubscribe from private feed\n"
+    "• `/mysubs` - List your subscriptions\n"
+    "• `/latestsub <name>` - Latest from your subscription\n\n"
+    "Use `!command` format for compatibility with other platforms."
+)
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start command"""
     await update.message.reply_text(
@@ -197,26 +222,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /help command"""
-    help_text = (
-        "📡 **RSS Bot Commands**\n\n"
-        "**Feed Management:**\n"
-        "• `/listfeeds` - List all feeds for this chat\n"
-        "• `/latest <feed_name>` - Show latest entry from a feed\n"
-        "• `/search <query>` - Search for RSS feeds\n"
-        "• `/getfeed <query>` - Find and show latest from a feed\n"
-        "• `/stats` - Show bot statistics\n\n"
-        "**Admin Commands:**\n"
-        "• `/addfeed <name> <url>` - Add RSS feed to this chat\n"
-        "• `/delfeed <name>` - Remove RSS feed from this chat\n"
-        "• `/getadd <query>` - Search and auto-add feed\n\n"
-        "**Personal Subscriptions:**\n"
-        "• `/addsub <name> <url>` - Subscribe to private feed\n"
-        "• `/unsub <name>` - Unsubscribe from private feed\n"
-        "• `/mysubs` - List your subscriptions\n"
-        "• `/latestsub <name>` - Latest from your subscription\n\n"
-        "Use `!command` format for compatibility with other platforms."
-    )
-    await update.message.reply_text(help_text, parse_mode="Markdown")
+    await update.message.reply_text(_HELP_TEXT, parse_mode="Markdown")
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle incoming messages and process commands"""
@@ -224,34 +230,35 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not message or not message.text:
         return
     
-    text = message.text.strip()
-    logging.info(f"[TELEGRAM] Raw message received: '{text}' from {message.from_user.username if message.from_user else 'unknown'}")
-    
-    if not (text.startswith('!') or text.startswith('/')):
-        logging.info(f"[TELEGRAM] Message doesn't start with ! or /, ignoring: '{text}'")
+    # Most group traffic is plain chatter: reject it before stripping or
+    # logging. Only text starting with whitespace needs the slower check.
+    text = message.text
+    if not text.startswith(('!', '/')) and not (text[0].isspace() and text.lstrip().startswith(('!', '/'))):
+        logging.debug("[TELEGRAM] Message doesn't start with ! or /, ignoring")
         return
     
+    text = text.strip()
+    logging.info("[TELEGRAM] Raw message received: '%s' from %s", text, message.from_user.username if message.from_user else 'unknown')
+    
     # Handle both /command and /command@FightPulseBot formats
     if text.startswith('/'):
         # Only remove bot username if it's at the end (/command@FightPulseBot -> /command)
         # But preserve arguments like /listfeeds @channel
-        parts = text.split(' ', 1)
-        command_part = parts[0]
-        args_part = parts[1] if len(parts) > 1 else ""
+        command_part, _, args_part = text.partition(' ')
         
         # Remove bot username from command only
-        if '@' in command_part:
-            command_part = command_part.split('@')[0]
+        at = command_part.find('@')
+        if at != -1:
+            command_part = command_part[:at]
         
-        # Reconstruct the full command
-        text = command_part + (' ' + args_part if args_part else '')
-        text = '!' + text[1:]
+        # Reconstruct the full command with ! in place of /
+        text = '!' + command_part[1:] + (' ' + args_part if args_part else '')
     
     user = message.from_user
     username = user.username if user else None
     chat_id = message.chat.id
     
-    logging.info(f"Telegram command from {username} in {chat_id}: {text}")
+    logging.info("Telegram command from %s in %s: %s", username, chat_id, text)
     
     # Use centralized command handler
     from commands import handle_centralized_command
@@ -266,12 +273,12 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     async def telegram_send_multiline(target, msg):
         # Split very long messages for Telegram's limits
         if len(msg) > 4000:
-            lines = msg.split('\n')
+            chunks = []
             current_msg = ""
-            for line in lines:
+            for line in msg.split('\n'):
                 if len(current_msg) + len(line) + 1 > 4000:
                     if current_msg:
-                        await send_telegram_message_async(chat_id, current_msg)
+                        chunks.append(current_msg)
                     current_msg = line
                 else:
                     if current_msg:
@@ -279,7 +286,11 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     else:
                         current_msg = line
             if current_msg:
-                await send_telegram_message_async(chat_id, current_msg)
+                chunks.append(current_msg)
+            # Chunks of a command reply need no dedup or coalescing; send them
+            # one after another so they arrive in order.
+            for chunk in chunks:
+                await _send_now(chat_id, chunk)
         else:
             await send_telegram_message_async(chat_id, msg)
     
@@ -300,11 +311,11 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
     """Handle errors in the Telegram bot"""
-    logging.error(f"Telegram bot error: {context.error}")
+    logging.error("Telegram bot error: %s", context.error)
 
 async def run_telegram_bot():
     """Main function to run the Telegram bot"""
-    global telegram_bot_instance, telegram_application
+    global telegram_bot_instance, telegram_application, telegram_loop
     
     logging.info("Starting Telegram bot...")
     
@@ -321,6 +332,11 @@ async def run_telegram_bot():
         if chat not in feed.channel_feeds:
             feed.channel_feeds[chat] = {}
     
+    # Python 3.12+: tasks (e.g. the per-command reply tasks) start running
+    # immediately and skip the scheduler if they finish without suspending.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Create application
     application = Application.builder().token(telegram_bot_token).build()
     telegram_application = application
@@ -335,36 +351,43 @@ async def run_telegram_bot():
     # Add error handler
     application.add_error_handler(error_handler)
     
-    logging.info(f"Telegram bot configured for chats: {telegram_chats}")
+    logging.info("Telegram bot configured for chats: %s", telegram_chats)
     
     # Start the bot
     try:
         await application.initialize()
+        telegram_loop = asyncio.get_running_loop()
         await application.start()
         await application.updater.start_polling()
         
         logging.info("Telegram bot is running...")
         
-        # Keep the bot running
-        while True:
-            await asyncio.sleep(1)
+        # Keep the bot running until SIGINT/SIGTERM when this loop owns the
+        # main thread; started from main.py it runs until the process exits
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                telegram_loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass  # not the main thread (started from main.py) or no signal support
+        await stop_event.wait()
             
     except Exception as e:
-        logging.error(f"Error running Telegram bot: {e}")
+        logging.error("Error running Telegram bot: %s", e)
     finally:
         if application:
             await application.stop()
 
 def start_telegram_bot():
-    """Start the Telegram bot in an asyncio event loop"""
+    """Start the Telegram bot in an asyncio event loop (uvloop if installed)"""
     try:
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         loop.run_until_complete(run_telegram_bot())
     except KeyboardInterrupt:
         logging.info("Telegram bot stopped by user")
     except Exception as e:
-        logging.error(f"Telegram bot error: {e}")
+        logging.error("Telegram bot error: %s", e)
     finally:
         loop.close()
 
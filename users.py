@@ -1,30 +1,79 @@
 # users.py
+import atexit
 import os
+import threading
 from persistence import load_json, save_json
 
 USERS_FILE = "users.json"
 # Structure: { "username": { "channels": [ "#channel1", "#channel2", ... ] } }
 users = {}
+# Reverse index for list_users: { "#channel": {"username", ...} }
+_channel_index = {}
+
+# add_user only marks users dirty; one write follows USERS_FLUSH_DELAY
+# seconds after the first unsaved change, however many adds come in between.
+USERS_FLUSH_DELAY = 5.0
+_users_dirty = False
+_users_lock = threading.Lock()
+_users_flush_timer = None
+
+def _rebuild_channel_index():
+    _channel_index.clear()
+    for username, data in users.items():
+        for channel in data.get("channels", []):
+            _channel_index.setdefault(channel, set()).add(username)
 
 def load_users():
     global users
     users = load_json(USERS_FILE, default={})
+    _rebuild_channel_index()
     return users
 
 def save_users():
+    global _users_dirty
+    _users_dirty = False
     save_json(USERS_FILE, users)
 
+def _mark_dirty():
+    global _users_dirty, _users_flush_timer
+    with _users_lock:
+        _users_dirty = True
+        if _users_flush_timer is None:
+            _users_flush_timer = threading.Timer(USERS_FLUSH_DELAY, flush_users)
+            _users_flush_timer.daemon = True
+            _users_flush_timer.start()
+
+def flush_users():
+    """Write pending add_user changes now instead of waiting for the timer."""
+    global _users_flush_timer
+    with _users_lock:
+        if _users_flush_timer is not None:
+            _users_flush_timer.cancel()
+            _users_flush_timer = None
+        dirty = _users_dirty
+    if dirty:
+        save_users()
+
+# The flush timer is a daemon thread, so make sure a pending write isn't lost on exit.
+atexit.register(flush_users)
+
 def add_user(username, channel=None):
     """
     Adds a user. If channel is provided and starts with '#',
     the user is associated with that channel.
     """
+    changed = False
     if username not in users:
         users[username] = {"channels": []}
+        changed = True
     if channel and channel.startswith("#"):
-        if channel not in users[username]["channels"]:
+        members = _channel_index.setdefault(channel, set())
+        if username not in members:
             users[username]["channels"].append(channel)
-    save_users()
+            members.add(username)
+            changed = True
+    if changed:
+        _mark_dirty()
 
 def get_user(username):
     return users.get(username)
@@ -35,6 +84,5 @@ def list_users(channel=None):
     If a channel (starting with '#') is specified, only users assigned to that channel are returned.
     """
     if channel and channel.startswith("#"):
-        return {user: data for user, data in users.items() if channel in data.get("channels", [])}
+        return {user: users[user] for user in _channel_index.get(channel, ())}
     return users
-